@@ -5,7 +5,8 @@ Exposes:
   GET    /admin/api/stats                         → aggregate counts
   GET    /admin/api/conversations                 → list (filters: status, lang, limit)
   GET    /admin/api/conversations/{id}            → conversation metadata
-  GET    /admin/api/conversations/{id}/messages   → message thread
+  GET    /admin/api/conversations/{id}/messages   → message thread, streamed (?stream=true → NDJSON)
+  GET    /admin/api/conversations/{id}/full       → metadata + message thread in one call
   GET    /admin/api/users/{user_id}/conversations → all convs for a user
 
   GET    /admin/api/agents                        → list all agents (Python + GCS merged)
@@ -20,43 +21,95 @@ If ADMIN_API_KEY is empty the API is open (dev only).
 Dashboard UI lives in sfl-multi-agents-admin.
 """
 
+import asyncio
+import hashlib
+import hmac
 import logging
+import time
+from functools import lru_cache
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Header, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
 
+import config
+from agents.tool_registry import list_available_tools
+from services.agent_gcs_store import delete_agent, load_all, save_agent
+from services.conversation_logger import conversation_logger
+
+# The hottest endpoints serialize with orjson and return the Response
+# themselves, skipping FastAPI's jsonable_encoder pass; the rest return dicts
+# and go through FastAPI's default JSON encoding.
 router = APIRouter(prefix="/admin", tags=["admin"])
 logger = logging.getLogger(__name__)
 
 
 # ── Auth dependency ───────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
+def _get_admin_key() -> bytes:
+    """ADMIN_API_KEY as bytes, read once from config on first use."""
+    return config.ADMIN_API_KEY.encode()
+
+
 async def require_admin(
     authorization: Optional[str] = Header(None),
     key: Optional[str] = Query(None),
 ) -> None:
-    import config
-    if not config.ADMIN_API_KEY:
+    expected = _get_admin_key()
+    if not expected:
         return  # open in dev mode
-    provided: Optional[str] = None
-    if authorization and authorization.startswith("Bearer "):
-        provided = authorization[7:].strip()
-    if not provided and key:
-        provided = key
-    if provided != config.ADMIN_API_KEY:
+    provided = (
+        authorization[7:].strip() if authorization and authorization.startswith("Bearer ") else ""
+    ) or key or ""
+    if not hmac.compare_digest(provided.encode(), expected):
         raise HTTPException(
             status_code=401,
             detail="Invalid or missing API key. Pass ?key=YOUR_KEY or Authorization: Bearer header.",
         )
 
 
+# ── Response cache ────────────────────────────────────────────────────────────
+# Short-lived in-process cache for tenant-global admin reads, so N open
+# dashboards polling the same view share one Cloud Logging aggregation.
+# Per-user endpoints are deliberately not cached.
+
+_STATS_TTL = 20.0
+_CONV_LIST_TTL = 10.0
+_RESPONSE_CACHE_MAX = 128
+_response_cache: dict[tuple, tuple[float, object]] = {}
+
+
+def _cache_get(key: tuple, ttl: float):
+    entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+
+def _cache_put(key: tuple, value) -> None:
+    if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+        _response_cache.clear()
+    _response_cache[key] = (time.monotonic(), value)
+
+
 # ── API routes — conversations & stats ───────────────────────────────────────
 
 @router.get("/api/stats")
 async def api_stats(_auth=Depends(require_admin)):
-    from services.conversation_logger import conversation_logger
-    return await conversation_logger.get_stats()
+    stats = _cache_get(("stats",), _STATS_TTL)
+    if stats is None:
+        stats = await conversation_logger.get_stats()
+        if stats:  # {} means Cloud Logging is unavailable — don't pin that
+            _cache_put(("stats",), stats)
+    return Response(content=orjson.dumps(stats), media_type="application/json")
+
+
+def _conv_list_payload(convs: list) -> tuple[bytes, str]:
+    """Serialized conversation list and its ETag."""
+    body = orjson.dumps(convs)
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
 
 
 @router.get("/api/conversations")
@@ -64,21 +117,30 @@ async def api_list_conversations(
     status: Optional[str] = None,
     lang: Optional[str] = None,
     limit: int = Query(50, ge=1, le=200),
+    if_none_match: Optional[str] = Header(None),
     _auth=Depends(require_admin),
 ):
-    from services.conversation_logger import conversation_logger
-    result = await conversation_logger.list_conversations(limit=limit)
-    convs = result.get("items", []) if isinstance(result, dict) else result
-    if status:
-        convs = [c for c in convs if c.get("status") == status]
-    if lang:
-        convs = [c for c in convs if c.get("language") == lang]
-    return convs
+    cache_key = ("conversations", status, lang, limit)
+    payload = _cache_get(cache_key, _CONV_LIST_TTL)
+    if payload is None:
+        convs = await conversation_logger.list_conversations(
+            limit=limit, status=status, language=lang
+        )
+        payload = _conv_list_payload(convs)
+        _cache_put(cache_key, payload)
+
+    # Validated by ETag only: closing or re-tagging a conversation changes the
+    # body without advancing any message timestamp, so Last-Modified would
+    # answer 304 for a stale list.
+    body, etag = payload
+    headers = {"etag": etag, "cache-control": "private, no-cache"}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/api/conversations/{conv_id}")
 async def api_get_conversation(conv_id: str, _auth=Depends(require_admin)):
-    from services.conversation_logger import conversation_logger
     conv = await conversation_logger.get_conversation(conv_id)
     if not conv:
         raise HTTPException(status_code=404, detail="Conversation not found.")
@@ -89,10 +151,63 @@ async def api_get_conversation(conv_id: str, _auth=Depends(require_admin)):
 async def api_get_messages(
     conv_id: str,
     limit: int = Query(100, ge=1, le=500),
+    stream: bool = False,
+    _auth=Depends(require_admin),
+):
+    if stream:
+        return StreamingResponse(
+            _ndjson_messages(conv_id, limit), media_type="application/x-ndjson"
+        )
+    return StreamingResponse(
+        _json_array_messages(conv_id, limit), media_type="application/json"
+    )
+
+
+@router.get("/api/conversations/{conv_id}/full")
+async def api_get_conversation_full(
+    conv_id: str,
+    limit: int = Query(200, ge=1, le=500),
     _auth=Depends(require_admin),
 ):
-    from services.conversation_logger import conversation_logger
-    return await conversation_logger.get_conversation_messages(conv_id, limit=limit)
+    """Conversation metadata and its messages, fetched concurrently in one request."""
+    conv, messages = await asyncio.gather(
+        conversation_logger.get_conversation(conv_id),
+        conversation_logger.get_conversation_messages(conv_id, limit=limit),
+    )
+    if not conv:
+        raise HTTPException(status_code=404, detail="Conversation not found.")
+    return Response(
+        content=orjson.dumps({"conversation": conv, "messages": messages}),
+        media_type="application/json",
+    )
+
+
+_STREAM_CHUNK = 32
+
+
+async def _json_array_messages(conv_id: str, limit: int):
+    """
+    The message list as one JSON array, flushed every _STREAM_CHUNK items so
+    the first bytes go out before the whole thread is loaded.
+    """
+    yield b"["
+    buf: list[bytes] = []
+    first = True
+    async for msg in conversation_logger.iter_conversation_messages(conv_id, limit=limit):
+        buf.append(orjson.dumps(msg))
+        if len(buf) >= _STREAM_CHUNK:
+            yield (b"" if first else b",") + b",".join(buf)
+            buf.clear()
+            first = False
+    if buf:
+        yield (b"" if first else b",") + b",".join(buf)
+    yield b"]"
+
+
+async def _ndjson_messages(conv_id: str, limit: int):
+    """One JSON object per line, written as each Cloud Logging page arrives."""
+    async for msg in conversation_logger.iter_conversation_messages(conv_id, limit=limit):
+        yield orjson.dumps(msg) + b"\n"
 
 
 @router.get("/api/users/{user_id}/conversations")
@@ -102,33 +217,95 @@ async def api_user_conversations(
     lang: Optional[str] = None,
     _auth=Depends(require_admin),
 ):
-    from services.conversation_logger import conversation_logger
-    result = await conversation_logger.list_conversations(user_id=user_id)
-    convs = result.get("items", []) if isinstance(result, dict) else result
-    if status:
-        convs = [c for c in convs if c.get("status") == status]
-    if lang:
-        convs = [c for c in convs if c.get("language") == lang]
-    return convs
+    return await conversation_logger.list_conversations(
+        user_id=user_id, status=status, language=lang
+    )
 
 
 # ── Agent management ──────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
+def _cached_plugins() -> tuple:
+    """Python source plugins, discovered once and reused until the runner is rebuilt."""
+    from orchestrator.agent_loader import AgentLoader  # deferred: pulls in ADK
+
+    return tuple(AgentLoader.get_instance().get_plugins())
+
+
+@lru_cache(maxsize=1)
+def _cached_plugins_by_name() -> dict:
+    """{name: plugin} view of _cached_plugins(). Treat as read-only."""
+    return {p.name: p for p in _cached_plugins()}
+
+
+# Short-lived cache of load_all() so concurrent dashboard polls share one store read.
+# For GET handlers only — mutations read the store directly so their duplicate
+# check and merge base are never stale. Invalidated after every
+# save_agent()/delete_agent() from this router; the generation counter keeps a
+# read that was in flight during an invalidation from storing its stale result.
+_GCS_CACHE_TTL = 5.0
+_gcs_cache: dict = {"t": 0.0, "data": None, "gen": 0}
+_gcs_cache_lock = asyncio.Lock()
+
+
+async def _load_all_cached() -> dict[str, dict]:
+    """Return load_all(), reusing the last result for _GCS_CACHE_TTL seconds. Treat as read-only."""
+    data = _gcs_cache["data"]
+    if data is not None and time.monotonic() - _gcs_cache["t"] < _GCS_CACHE_TTL:
+        return data
+    async with _gcs_cache_lock:
+        data = _gcs_cache["data"]
+        if data is not None and time.monotonic() - _gcs_cache["t"] < _GCS_CACHE_TTL:
+            return data
+        gen = _gcs_cache["gen"]
+        data = await asyncio.to_thread(load_all)
+        if _gcs_cache["gen"] == gen:
+            _gcs_cache["t"] = time.monotonic()
+            _gcs_cache["data"] = data
+    return data
+
+
+def _invalidate_gcs_cache() -> None:
+    _gcs_cache["gen"] += 1
+    _gcs_cache["data"] = None
+
+
+# Tool names per Python plugin, memoized until the runner is rebuilt.
+_tool_names_cache: dict[str, tuple[str, ...]] = {}
+
+
 def _agent_tools_list(plugin) -> list[str]:
-    """Get tool names from a Python plugin's get_tools() result."""
-    try:
-        return [t.__name__ if callable(t) else str(t) for t in (plugin.get_tools() or [])]
-    except Exception:
-        return []
+    """Get tool names from a Python plugin's get_tools() result (memoized by plugin name)."""
+    names = _tool_names_cache.get(plugin.name)
+    if names is None:
+        try:
+            names = tuple(getattr(t, "__name__", None) or str(t) for t in (plugin.get_tools() or ()))
+        except Exception:
+            names = ()
+        _tool_names_cache[plugin.name] = names
+    return list(names)
+
+
+@lru_cache(maxsize=1)
+def _cached_tools_payload() -> tuple[bytes, str]:
+    """Serialized list_available_tools() and its ETag, computed once until the runner is rebuilt."""
+    body = orjson.dumps(list_available_tools())
+    return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
 
 
 # ── GET /api/agents/tools  (must be registered BEFORE /api/agents/{name}) ────
 
 @router.get("/api/agents/tools")
-async def api_list_tools(_auth=Depends(require_admin)):
+async def api_list_tools(
+    if_none_match: Optional[str] = Header(None),
+    _auth=Depends(require_admin),
+):
     """Return all registered tools available for agent configuration."""
-    from agents.tool_registry import list_available_tools
-    return list_available_tools()
+    body, etag = _cached_tools_payload()
+    headers = {"etag": etag, "cache-control": "private, no-cache"}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # ── GET /api/agents ───────────────────────────────────────────────────────────
@@ -136,33 +313,41 @@ async def api_list_tools(_auth=Depends(require_admin)):
 @router.get("/api/agents")
 async def api_list_agents(_auth=Depends(require_admin)):
     """Return all agents — Python source (with any GCS overrides) plus GCS-only agents."""
-    from orchestrator.agent_loader import AgentLoader
-    from services.agent_gcs_store import load_all
-
-    loader = AgentLoader()
-    plugins = loader.get_plugins()
-    gcs_configs = load_all()
-    python_names = {p.name for p in plugins}
+    by_name = _cached_plugins_by_name()
+    gcs_configs = await _load_all_cached()
 
     result = []
 
     # Python source agents (override from GCS if present)
-    for p in plugins:
-        override = gcs_configs.get(p.name, {})
+    for name, p in by_name.items():
+        override = gcs_configs.get(name)
+        if override is None:
+            result.append({
+                "name": name,
+                "model": p.model,
+                "instruction": p.instruction,
+                "routing_hint": getattr(p, "routing_hint", ""),
+                "is_fallback": p.is_fallback,
+                "tools": _agent_tools_list(p),
+                "source": "python",
+                "has_python_source": True,
+            })
+            continue
         result.append({
-            "name": p.name,
+            "name": name,
             "model": override.get("model", p.model),
             "instruction": override.get("instruction", p.instruction),
             "routing_hint": override.get("routing_hint", getattr(p, "routing_hint", "")),
             "is_fallback": override.get("is_fallback", p.is_fallback),
-            "tools": override.get("tools", _agent_tools_list(p)),
-            "source": "gcs" if p.name in gcs_configs else "python",
+            # Only resolve the plugin's tools when the override does not replace them
+            "tools": override["tools"] if "tools" in override else _agent_tools_list(p),
+            "source": "gcs",
             "has_python_source": True,
         })
 
     # GCS-only agents (not present in Python source files)
     for name, cfg in gcs_configs.items():
-        if name not in python_names:
+        if name not in by_name:
             result.append({**cfg, "source": "gcs", "has_python_source": False})
 
     return result
@@ -182,24 +367,19 @@ class CreateAgent(BaseModel):
 @router.post("/api/agents", status_code=201)
 async def api_create_agent(body: CreateAgent, _auth=Depends(require_admin)):
     """Create a new GCS-managed agent. Fails if the name already exists."""
-    from orchestrator.agent_loader import AgentLoader
-    from services.agent_gcs_store import load_all, save_agent
-
     # Check for name conflicts across Python source and GCS
-    loader = AgentLoader()
-    python_names = {p.name for p in loader.get_plugins()}
-    gcs_names = set(load_all().keys())
-    if body.name in python_names | gcs_names:
+    if body.name in _cached_plugins_by_name() or body.name in await asyncio.to_thread(load_all):
         raise HTTPException(status_code=409, detail=f"Agent '{body.name}' already exists.")
 
     agent_dict = {**body.model_dump(), "source": "gcs"}
     try:
         save_agent(agent_dict)
+        _invalidate_gcs_cache()
     except OSError as exc:
         logger.error("Failed to save new agent '%s': %s", body.name, exc)
         raise HTTPException(status_code=500, detail=str(exc))
 
-    _try_rebuild_runner(body.name, "created")
+    _schedule_rebuild(body.name, "created")
     return agent_dict
 
 
@@ -222,55 +402,38 @@ async def api_patch_agent(
     Update an agent's fields and persist to GCS/local store.
     Works for both Python source agents (override) and GCS-managed agents.
     """
-    from orchestrator.agent_loader import AgentLoader
-    from services.agent_gcs_store import load_all, save_agent
-
-    loader = AgentLoader()
-    plugins = loader.get_plugins()
-    plugin = next((p for p in plugins if p.name == agent_name), None)
-    gcs_configs = load_all()
+    plugin = _cached_plugins_by_name().get(agent_name)
+    gcs_configs = await asyncio.to_thread(load_all)
     current_gcs = gcs_configs.get(agent_name, {})
 
     if plugin is None and agent_name not in gcs_configs:
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found.")
 
-    # Build the merged record: start from current GCS (or derive from Python plugin)
+    # Build the merged record in layers: Python source defaults → current GCS
+    # override → request body. The plugin's tool list is only resolved when
+    # neither of the later layers provides one.
     updated = {
         "name": agent_name,
-        "routing_hint": current_gcs.get(
-            "routing_hint", getattr(plugin, "routing_hint", "") if plugin else ""
-        ),
-        "instruction": current_gcs.get(
-            "instruction", plugin.instruction if plugin else ""
-        ),
-        "model": current_gcs.get(
-            "model", plugin.model if plugin else "gemini-2.5-flash"
-        ),
-        "is_fallback": current_gcs.get(
-            "is_fallback", plugin.is_fallback if plugin else False
-        ),
-        "tools": current_gcs.get(
-            "tools", _agent_tools_list(plugin) if plugin else ["transfer_to_triage"]
-        ),
-        "source": "gcs",
+        "routing_hint": getattr(plugin, "routing_hint", "") if plugin else "",
+        "instruction": plugin.instruction if plugin else "",
+        "model": plugin.model if plugin else "gemini-2.5-flash",
+        "is_fallback": plugin.is_fallback if plugin else False,
     }
-
-    if body.instruction is not None:
-        updated["instruction"] = body.instruction
-    if body.routing_hint is not None:
-        updated["routing_hint"] = body.routing_hint
-    if body.model is not None:
-        updated["model"] = body.model
-    if body.tools is not None:
-        updated["tools"] = body.tools
+    if "tools" not in current_gcs and body.tools is None:
+        updated["tools"] = _agent_tools_list(plugin) if plugin else ["transfer_to_triage"]
+    updated.update(current_gcs)
+    updated.update(body.model_dump(exclude_unset=True, exclude_none=True))
+    updated["name"] = agent_name
+    updated["source"] = "gcs"
 
     try:
         save_agent(updated)
+        _invalidate_gcs_cache()
     except OSError as exc:
         logger.error("Failed to save agent '%s': %s", agent_name, exc)
         raise HTTPException(status_code=500, detail=str(exc))
 
-    _try_rebuild_runner(agent_name, "updated")
+    _schedule_rebuild(agent_name, "updated")
     return updated
 
 
@@ -282,11 +445,7 @@ async def api_delete_agent(agent_name: str, _auth=Depends(require_admin)):
     Delete a GCS-managed agent. Python source agents cannot be deleted from the admin
     (remove the .py file from agents/specialists/ instead).
     """
-    from orchestrator.agent_loader import AgentLoader
-    from services.agent_gcs_store import delete_agent
-
-    loader = AgentLoader()
-    if any(p.name == agent_name for p in loader.get_plugins()):
+    if agent_name in _cached_plugins_by_name():
         raise HTTPException(
             status_code=400,
             detail=(
@@ -296,10 +455,11 @@ async def api_delete_agent(agent_name: str, _auth=Depends(require_admin)):
         )
 
     deleted = delete_agent(agent_name)
+    _invalidate_gcs_cache()
     if not deleted:
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found.")
 
-    _try_rebuild_runner(agent_name, "deleted")
+    _schedule_rebuild(agent_name, "deleted")
     return {"deleted": agent_name}
 
 
@@ -311,31 +471,57 @@ async def api_reset_agent(agent_name: str, _auth=Depends(require_admin)):
     Remove the GCS override for a Python source agent, reverting it to its
     Python source defaults. Has no effect if no override exists.
     """
-    from orchestrator.agent_loader import AgentLoader
-    from services.agent_gcs_store import delete_agent
-
-    loader = AgentLoader()
-    if not any(p.name == agent_name for p in loader.get_plugins()):
+    if agent_name not in _cached_plugins_by_name():
         raise HTTPException(
             status_code=400,
             detail=f"'{agent_name}' is not a Python source agent. Use DELETE to remove GCS agents.",
         )
 
     deleted = delete_agent(agent_name)
-    _try_rebuild_runner(agent_name, "reset to Python defaults")
+    _invalidate_gcs_cache()
+    _schedule_rebuild(agent_name, "reset to Python defaults")
     return {"reset": agent_name, "had_override": deleted}
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _try_rebuild_runner(agent_name: str, action: str) -> None:
-    """Rebuild the ADK runner after an agent change. Logs but never raises."""
+# Runner rebuilds happen after the response is sent. Changes arriving within
+# _REBUILD_DEBOUNCE seconds of each other (or during a rebuild) are coalesced.
+_REBUILD_DEBOUNCE = 0.2
+_pending_changes: list[tuple[str, str]] = []
+_rebuild_task: Optional[asyncio.Task] = None
+
+
+def _schedule_rebuild(agent_name: str, action: str) -> None:
+    """Queue a runner rebuild for an agent change without blocking the request."""
+    global _rebuild_task
+    _pending_changes.append((agent_name, action))
+    if _rebuild_task is None or _rebuild_task.done():
+        _rebuild_task = asyncio.create_task(_debounced_rebuild())
+
+
+async def _debounced_rebuild() -> None:
+    while _pending_changes:
+        await asyncio.sleep(_REBUILD_DEBOUNCE)
+        changes = _pending_changes[:]
+        _pending_changes.clear()
+        await asyncio.to_thread(_try_rebuild_runner, changes)
+
+
+def _try_rebuild_runner(changes: list[tuple[str, str]]) -> None:
+    """Rebuild the ADK runner after one or more agent changes. Logs but never raises."""
+    summary = ", ".join(f"'{name}' {action}" for name, action in changes)
     try:
-        from orchestrator.adk_runner import rebuild_runner
+        from orchestrator.adk_runner import rebuild_runner  # deferred: pulls in ADK
+
         rebuild_runner()
-        logger.info("Runner rebuilt after agent '%s' was %s.", agent_name, action)
+        _tool_names_cache.clear()
+        _cached_plugins.cache_clear()
+        _cached_plugins_by_name.cache_clear()
+        _cached_tools_payload.cache_clear()
+        logger.info("Runner rebuilt after agent changes: %s.", summary)
     except Exception as exc:
         logger.warning(
-            "Agent '%s' %s in store, but runner rebuild failed: %s",
-            agent_name, action, exc,
+            "Agent changes saved in store (%s), but runner rebuild failed: %s",
+            summary, exc,
         )
@@ -14,12 +14,10 @@ Usage in provision (deploy to Vertex AI Agent Engine):
 The FastAPI backend imports root_agent from here via adk_runner.py.
 """
 import config  # Must be first — sets env vars before ADK initializes
-from orchestrator.agent_loader import AgentLoader
-from agents.triage import build_triage_agent
-
-_loader = AgentLoader()
-_specialists, _fallback = _loader.build_agents_merged()
+from orchestrator.root import get_root_agent
 
 # root_agent: full tree Triage → [Booking, Support, Property, HelpCenter] + any GCS agents
 # ADK uses this variable to discover the multi-agent system.
-root_agent = build_triage_agent(_specialists, _fallback)
+# Built once per process in orchestrator.root, so re-importing this module
+# (adk web, provision.py, adk_runner.py) never wires the specialists twice.
+root_agent = get_root_agent()
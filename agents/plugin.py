@@ -10,10 +10,10 @@ Keeping this definition separate from agent_loader.py avoids circular imports:
     agent_loader.py   →  agents/plugin.py  +  agents/specialists.*
 """
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, Sequence
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentPlugin:
     name: str
     """Agent name. Must match LlmAgent.name and be unique within the app."""
@@ -24,7 +24,7 @@ class AgentPlugin:
 
     instruction: str
     """Full system prompt for the agent. May contain {lang_name} —
-    ADK interpolates it automatically from the session state."""
+    filled from the session state on each turn (see compile_instruction)."""
 
     model: str
     """Gemini model name, e.g. config.GEMINI_MODEL."""
@@ -33,6 +33,7 @@ class AgentPlugin:
     """True only for the last-resort fallback agent (HelpCenter/Knowledge).
     Exactly 1 plugin in specialists/ must have is_fallback=True."""
 
-    get_tools: Callable[[], list] = field(default_factory=lambda: (lambda: []))
-    """Zero-argument callable that returns the list of tool functions.
-    Called in build_agents() to attach local tools to the LlmAgent."""
+    get_tools: Callable[[], Sequence] = field(default_factory=lambda: (lambda: ()))
+    """Zero-argument callable that returns the tool functions (a constant
+    tuple in the built-in specialists). Called in build_agents() to attach
+    local tools to the LlmAgent; treat the result as read-only."""
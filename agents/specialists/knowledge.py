@@ -1,63 +1,272 @@
+import asyncio
 import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from itertools import islice
 from agents.utils import transfer_to_triage
 from agents.constants import STAYFORLONG_CONTACT
 import config
 from agents.plugin import AgentPlugin
 
+try:
+    from google.cloud import discoveryengine_v1 as discoveryengine
+except ImportError:  # search unavailable; query_help_center falls back to contact info
+    discoveryengine = None
+
 logger = logging.getLogger(__name__)
 
 _contact = STAYFORLONG_CONTACT
 
+# Contact footers and canned replies are constant — build them once.
+_FOOTER_SHORT = f"📞 {_contact['phone']} | ✉️ {_contact['email']}"
+_FOOTER_FULL = f"{_FOOTER_SHORT} | {_contact['hours']}"
+_NO_INFO = (
+    "No specific information was found for that in the help center. "
+    f"Please contact our team: {_FOOTER_FULL}"
+)
+_UNREACHABLE = (
+    "Could not reach the help center at this moment. "
+    f"Please contact Stayforlong: {_FOOTER_SHORT}"
+)
 
-def _search_vertex_ai(query: str) -> str:
-    """Query the Vertex AI Search data store and return a synthesised answer."""
-    from google.cloud import discoveryengine_v1 as discoveryengine
+# ── Query prefilter ───────────────────────────────────────────────────────────
+# Inputs the help center can't answer are settled locally, without an RPC.
+
+_BOOKING_RE = re.compile(r"\bSFL-[A-Z0-9]{4}-\d+", re.IGNORECASE)
+_GREETINGS = frozenset({
+    "hi", "hello", "hey", "hola", "buenas", "buenos dias", "buenos días",
+    "buenas tardes", "buenas noches", "ok", "okay", "vale", "gracias", "thanks",
+})
+_BOOKING_REDIRECT = (
+    "This question is about a specific reservation. The help center only covers "
+    "general platform questions — call transfer_to_triage so Booking can look it up."
+)
+
+
+def _prefilter(question: str):
+    """Canned reply for trivial or out-of-scope questions, or None to search."""
+    q = question.strip()
+    if len(q) < 3:
+        return _NO_INFO
+    if _BOOKING_RE.search(q):
+        return _BOOKING_REDIRECT
+    if q.casefold().rstrip("!.?¡¿ ") in _GREETINGS:
+        return ""  # nothing to look up — let the model carry on the dialog
+    return None
+
+
+# ── Answer cache ──────────────────────────────────────────────────────────────
+# Help-center FAQs repeat verbatim across guests; answer them from memory
+# instead of paying a Vertex AI Search round-trip each time.
+
+_CACHE_TTL = 3600.0
+_CACHE_MAX = 2048
+_answer_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+
+def _cache_key(question: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", question).casefold().split())
+
+
+def _cache_get(key: str):
+    entry = _answer_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= _CACHE_TTL:
+        _answer_cache.pop(key, None)
+        return None
+    _answer_cache.move_to_end(key)
+    return entry[1]
+
+
+def _cache_put(key: str, answer: str) -> None:
+    _answer_cache[key] = (time.monotonic(), answer)
+    _answer_cache.move_to_end(key)
+    while len(_answer_cache) > _CACHE_MAX:
+        _answer_cache.popitem(last=False)
+
+
+# ── In-flight coalescing ──────────────────────────────────────────────────────
+# Guests asking the same question at the same time share one search RPC
+# instead of each issuing their own. The search caches its own answer, so one
+# that finishes after every waiter has timed out still serves the next guest.
+
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def _finish_search(key: str, fut: asyncio.Future) -> None:
+    if _inflight.get(key) is fut:
+        del _inflight[key]
+    if not fut.cancelled() and fut.exception() is None and fut.result():
+        _cache_put(key, fut.result())
+
+
+def _shared_search(key: str, question: str) -> asyncio.Future:
+    fut = _inflight.get(key)
+    if fut is None or fut.get_loop() is not asyncio.get_running_loop():
+        fut = asyncio.ensure_future(_search_vertex_ai(question))
+        _inflight[key] = fut
+        fut.add_done_callback(lambda f: _finish_search(key, f))
+    return fut
+
+
+# ── Search client singleton ───────────────────────────────────────────────────
+# One client per process so the gRPC channel (TLS session, ADC token) stays
+# open and later searches reuse it. grpc.aio channels are bound to the loop
+# that created them, so the client is rebuilt if the running loop changes.
+
+_search_client = None       # discoveryengine.SearchServiceAsyncClient
+_search_client_loop = None  # loop _search_client is bound to
+_resolved_cfg = None    # preferred serving_config that answered; skips the probe loop
+
+
+def _get_search_client():
+    global _search_client, _search_client_loop
+    loop = asyncio.get_running_loop()
+    if _search_client is None or _search_client_loop is not loop:
+        _search_client = discoveryengine.SearchServiceAsyncClient()
+        _search_client_loop = loop
+    return _search_client
 
-    project = config.GOOGLE_CLOUD_PROJECT
-    datastore_id = config.VERTEX_AI_SEARCH_ENGINE_ID
-
-    client = discoveryengine.SearchServiceClient()
-
-    base = f"projects/{project}/locations/global/collections/default_collection"
-    candidate_configs = [
-        f"{base}/engines/{datastore_id}/servingConfigs/default_search",
-        f"{base}/engines/{datastore_id}/servingConfigs/default_config",
-        f"{base}/dataStores/{datastore_id}/servingConfigs/default_search",
-        f"{base}/dataStores/{datastore_id}/servingConfigs/default_config",
-    ]
-
-    def _build_request(serving_config: str) -> discoveryengine.SearchRequest:
-        return discoveryengine.SearchRequest(
-            serving_config=serving_config,
-            query=query,
-            page_size=5,
-            content_search_spec=discoveryengine.SearchRequest.ContentSearchSpec(
-                summary_spec=discoveryengine.SearchRequest.ContentSearchSpec.SummarySpec(
-                    summary_result_count=5,
-                    include_citations=False,
-                    language_code="es",
-                ),
-                snippet_spec=discoveryengine.SearchRequest.ContentSearchSpec.SnippetSpec(
-                    return_snippet=True,
-                ),
-            ),
-            query_expansion_spec=discoveryengine.SearchRequest.QueryExpansionSpec(
-                condition=discoveryengine.SearchRequest.QueryExpansionSpec.Condition.AUTO,
-            ),
-        )
+
+_HEDGE_DELAY = config.HELP_CENTER_HEDGE_MS / 1000
+_RPC_TIMEOUT = config.HELP_CENTER_TIMEOUT
+
+# Once a serving_config answers during the probe race, how long (seconds) to
+# keep waiting for a higher-preference candidate that is still in flight.
+_PREFERENCE_GRACE = 0.25
+# Worst case for one _search_vertex_ai call: the pinned config's hedged search
+# times out, then the re-probe race runs to its own RPC deadline.
+_SEARCH_BUDGET = (_RPC_TIMEOUT + _HEDGE_DELAY) + _RPC_TIMEOUT + _PREFERENCE_GRACE
+
+
+async def _hedged_search(client, request):
+    """client.search(request), re-sent once if the first try is slower than _HEDGE_DELAY."""
+    if not _HEDGE_DELAY:
+        return await client.search(request, timeout=_RPC_TIMEOUT)
+    first = asyncio.ensure_future(client.search(request, timeout=_RPC_TIMEOUT))
+    tasks = {first}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=_HEDGE_DELAY)
+        if not done:
+            tasks.add(asyncio.ensure_future(client.search(request, timeout=_RPC_TIMEOUT)))
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                if t.exception() is None:
+                    return t.result()
+        return first.result()  # every attempt failed — surface the original error
+    finally:
+        for t in tasks:
+            t.cancel()
+
+
+# Without an engine ID or the SDK there is nothing to search.
+_SEARCH_ENABLED = bool(config.VERTEX_AI_SEARCH_ENGINE_ID and discoveryengine)
+
+# Serving configs to try, in preference order (see the probe race in
+# _search_vertex_ai). The project and engine ID are fixed for the life of the
+# process, so the paths are built once.
+_BASE = (
+    f"projects/{config.GOOGLE_CLOUD_PROJECT}"
+    "/locations/global/collections/default_collection"
+)
+_CANDIDATE_CFGS: tuple[str, ...] = (
+    f"{_BASE}/engines/{config.VERTEX_AI_SEARCH_ENGINE_ID}/servingConfigs/default_search",
+    f"{_BASE}/engines/{config.VERTEX_AI_SEARCH_ENGINE_ID}/servingConfigs/default_config",
+    f"{_BASE}/dataStores/{config.VERTEX_AI_SEARCH_ENGINE_ID}/servingConfigs/default_search",
+    f"{_BASE}/dataStores/{config.VERTEX_AI_SEARCH_ENGINE_ID}/servingConfigs/default_config",
+)
+
+
+# Everything but serving_config and query is the same for every search, so the
+# nested spec messages are built once and copied into each request.
+_REQUEST_TEMPLATE = discoveryengine and discoveryengine.SearchRequest(
+    page_size=5,
+    content_search_spec=discoveryengine.SearchRequest.ContentSearchSpec(
+        summary_spec=discoveryengine.SearchRequest.ContentSearchSpec.SummarySpec(
+            summary_result_count=5,
+            include_citations=False,
+            language_code="es",
+        ),
+        snippet_spec=discoveryengine.SearchRequest.ContentSearchSpec.SnippetSpec(
+            return_snippet=True,
+        ),
+    ),
+    query_expansion_spec=discoveryengine.SearchRequest.QueryExpansionSpec(
+        condition=discoveryengine.SearchRequest.QueryExpansionSpec.Condition.AUTO,
+    ),
+)
+
+
+def _build_request(serving_config: str, query: str) -> "discoveryengine.SearchRequest":
+    return discoveryengine.SearchRequest(
+        _REQUEST_TEMPLATE, serving_config=serving_config, query=query
+    )
+
+
+async def _search_vertex_ai(query: str) -> str:
+    """Query the Vertex AI Search data store and return a synthesised answer."""
+    global _resolved_cfg
+    if not _SEARCH_ENABLED:
+        raise RuntimeError("Vertex AI Search is not configured (VERTEX_AI_SEARCH_ENGINE_ID).")
+    client = _get_search_client()
 
     response = None
     last_exc = None
-    for cfg in candidate_configs:
+    if _resolved_cfg:
         try:
-            logger.info("Trying serving_config: %s", cfg)
-            response = client.search(_build_request(cfg))
-            logger.info("Success with serving_config: %s", cfg)
-            break
+            response = await _hedged_search(client, _build_request(_resolved_cfg, query))
         except Exception as exc:
-            logger.warning("Failed serving_config %s: %s", cfg, exc)
+            logger.warning("Resolved serving_config %s failed, re-probing: %s", _resolved_cfg, exc)
+            _resolved_cfg = None
             last_exc = exc
 
+    if response is None:
+        # Race every candidate. The highest-preference config that answers wins:
+        # after the first success, higher-ranked candidates still in flight get
+        # _PREFERENCE_GRACE to finish, and everything ranked lower is cancelled.
+        loop = asyncio.get_running_loop()
+        pending = {
+            asyncio.ensure_future(
+                client.search(_build_request(cfg, query), timeout=_RPC_TIMEOUT)
+            ): rank
+            for rank, cfg in enumerate(_CANDIDATE_CFGS)
+        }
+        best_rank = None
+        deadline = None
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break  # grace period over; keep the best answer so far
+                for task in done:
+                    rank = pending.pop(task)
+                    if task.exception() is not None:
+                        logger.warning(
+                            "Failed serving_config %s: %s", _CANDIDATE_CFGS[rank], task.exception()
+                        )
+                        last_exc = task.exception()
+                    elif best_rank is None or rank < best_rank:
+                        best_rank, response = rank, task.result()
+                        if deadline is None:
+                            deadline = loop.time() + _PREFERENCE_GRACE
+                if best_rank is not None:
+                    for task in [t for t, r in pending.items() if r > best_rank]:
+                        del pending[task]
+                        task.cancel()
+        finally:
+            for task in pending:
+                task.cancel()
+        if best_rank is not None:
+            _resolved_cfg = _CANDIDATE_CFGS[best_rank]
+            logger.info("Success with serving_config: %s", _resolved_cfg)
+
     if response is None:
         raise last_exc
 
@@ -69,41 +278,75 @@ def _search_vertex_ai(query: str) -> str:
     if summary_text:
         return summary_text
 
-    # Fall back to concatenating the top snippets
-    snippets = []
-    for result in response.results:
-        doc_data = result.document.derived_struct_data
-        for snippet_item in doc_data.get("snippets", []):
-            snippet = snippet_item.get("snippet", "").strip()
-            if snippet:
-                snippets.append(snippet)
-    if snippets:
-        return "\n\n".join(snippets[:3])
-
-    return ""
+    # Fall back to concatenating the top snippets; stop reading after the third
+    snippets = (
+        snippet
+        for result in response.results
+        for snippet_item in result.document.derived_struct_data.get("snippets", [])
+        if (snippet := snippet_item.get("snippet", "").strip())
+    )
+    return "\n\n".join(islice(snippets, 3))
 
 
-def query_help_center(question: str) -> str:
+async def query_help_center(question: str) -> str:
     """Search the Stayforlong help center (powered by Vertex AI Search) for answers about
     platform FAQs, policies, payment methods, minimum stay rules, stay extensions,
     cancellation policies and general platform questions.
     Accepts any question in Spanish or English."""
+    if not _SEARCH_ENABLED:
+        return _UNREACHABLE
+    canned = _prefilter(question)
+    if canned is not None:
+        return canned
+    key = _cache_key(question)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     try:
-        result = _search_vertex_ai(question)
-        if result:
-            return result
-        return (
-            "No specific information was found for that in the help center. "
-            f"Please contact our team: 📞 {_contact['phone']} | "
-            f"✉️ {_contact['email']} | {_contact['hours']}"
+        # shield: one waiter being cancelled must not cancel the shared search
+        result = await asyncio.wait_for(
+            asyncio.shield(_shared_search(key, question)),
+            timeout=_SEARCH_BUDGET + 1,  # safety net over the RPC deadlines
         )
+        return result or _NO_INFO
     except Exception as exc:
         logger.error("query_help_center failed: %s", exc, exc_info=True)
-        return (
-            "Could not reach the help center at this moment. "
-            f"Please contact Stayforlong: 📞 {_contact['phone']} | ✉️ {_contact['email']}"
-        )
+        return _UNREACHABLE
+
+
+_INSTRUCTION = (
+    "You are the Stayforlong help center specialist. Always respond in the language the user writes in; default to {lang_name} if unclear. "
+    "You have been transferred from the main assistant — the user's question is already in the conversation. "
+    "NEVER greet the user or say 'Hola' / 'Hello' / 'How can I help' — go straight to answering.\n\n"
+
+    "SCOPE — what you handle:\n"
+    "✅ General platform questions: how Stayforlong works, what it is, who it's for\n"
+    "✅ Policies: cancellation policies, payment methods, deposit rules\n"
+    "✅ Stay rules: minimum stay, extensions, early check-out\n"
+    "✅ Billing: invoices, VAT, payment issues\n"
+    "✅ Account: registration, login, profile management\n"
+    "✅ FAQs: any general question about the platform\n"
+    "✅ Any question not handled by other specialists — you are the final fallback\n\n"
 
+    "TRANSFER to another specialist ONLY for these specific cases:\n"
+    "🔄 User provides a booking ID (SFL-XXXX-NNN) or email and asks for their specific "
+    "reservation details → call transfer_to_triage\n"
+    "🔄 Active incidents, maintenance problems, complaints during stay → call transfer_to_triage\n"
+    "🔄 Specific property amenities, check-in times, facilities → call transfer_to_triage\n"
+    "• If user asks about their reservation WITHOUT providing a booking ID or email, "
+    "ask them to provide it: 'Para consultar tu reserva específica, necesito tu ID de reserva "
+    "(formato SFL-XXXX-NNN) o tu email.'\n\n"
+
+    "INSTRUCTIONS:\n"
+    "• For questions within your scope, call query_help_center first.\n"
+    "• Present the answer clearly in the language the user is writing in.\n"
+    "• For anything truly unknown or unanswerable, NEVER call transfer_to_triage — "
+    "instead provide the support contact directly:\n"
+    f"  {_FOOTER_FULL}\n"
+    "• You are the last resort: always resolve or provide contact info, never leave the guest without an answer."
+)
+
+_TOOLS = (query_help_center, transfer_to_triage)
 
 PLUGIN = AgentPlugin(
     name="HelpCenter",
@@ -111,38 +354,8 @@ PLUGIN = AgentPlugin(
         "General platform FAQs, policies, payment methods, minimum stay, "
         "extensions, account questions, and any topic not covered by other specialists"
     ),
-    instruction=(
-        "You are the Stayforlong help center specialist. Always respond in the language the user writes in; default to {lang_name} if unclear. "
-        "You have been transferred from the main assistant — the user's question is already in the conversation. "
-        "NEVER greet the user or say 'Hola' / 'Hello' / 'How can I help' — go straight to answering.\n\n"
-
-        "SCOPE — what you handle:\n"
-        "✅ General platform questions: how Stayforlong works, what it is, who it's for\n"
-        "✅ Policies: cancellation policies, payment methods, deposit rules\n"
-        "✅ Stay rules: minimum stay, extensions, early check-out\n"
-        "✅ Billing: invoices, VAT, payment issues\n"
-        "✅ Account: registration, login, profile management\n"
-        "✅ FAQs: any general question about the platform\n"
-        "✅ Any question not handled by other specialists — you are the final fallback\n\n"
-
-        "TRANSFER to another specialist ONLY for these specific cases:\n"
-        "🔄 User provides a booking ID (SFL-XXXX-NNN) or email and asks for their specific "
-        "reservation details → call transfer_to_triage\n"
-        "🔄 Active incidents, maintenance problems, complaints during stay → call transfer_to_triage\n"
-        "🔄 Specific property amenities, check-in times, facilities → call transfer_to_triage\n"
-        "• If user asks about their reservation WITHOUT providing a booking ID or email, "
-        "ask them to provide it: 'Para consultar tu reserva específica, necesito tu ID de reserva "
-        "(formato SFL-XXXX-NNN) o tu email.'\n\n"
-
-        "INSTRUCTIONS:\n"
-        "• For questions within your scope, call query_help_center first.\n"
-        "• Present the answer clearly in the language the user is writing in.\n"
-        "• For anything truly unknown or unanswerable, NEVER call transfer_to_triage — "
-        "instead provide the support contact directly:\n"
-        f"  📞 {_contact['phone']}  |  ✉️ {_contact['email']}  |  {_contact['hours']}\n"
-        "• You are the last resort: always resolve or provide contact info, never leave the guest without an answer."
-    ),
+    instruction=_INSTRUCTION,
     model=config.GEMINI_MODEL,
     is_fallback=True,  # HelpCenter is the last-resort fallback agent
-    get_tools=lambda: [query_help_center, transfer_to_triage],
+    get_tools=lambda: _TOOLS,
 )
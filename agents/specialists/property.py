@@ -1,71 +1,116 @@
-import json
+import re
+from operator import itemgetter
+import orjson
 from agents.utils import transfer_to_triage
 from mock_data.properties import PROPERTIES, PROPERTY_ALIASES
 from agents.constants import STAYFORLONG_CONTACT, STAYFORLONG_BASE_URL
 import config
 from agents.plugin import AgentPlugin
 
+
+def _dumps(obj: dict) -> str:
+    return orjson.dumps(obj).decode()
+
+
 PROPERTY_URLS = {
     "PROP-BCN-001": f"{STAYFORLONG_BASE_URL}/apartamentos-barcelona/gran-via",
     "PROP-MAD-003": f"{STAYFORLONG_BASE_URL}/apartamentos-madrid/salamanca",
     "PROP-LIS-002": f"{STAYFORLONG_BASE_URL}/apartamentos-lisboa/lx-factory",
 }
 
+# Resolve each listing URL once and keep it on the property record itself.
+for _pid, _prop in PROPERTIES.items():
+    _prop["stayforlong_url"] = PROPERTY_URLS.get(_pid, STAYFORLONG_BASE_URL)
+
+
+# Every alias, alias word, and name/city word that identifies exactly one
+# property → its property_id. Built once; replaces a substring scan per lookup.
+_WORD_RE = re.compile(r"\w+")
+
+
+def _build_alias_index() -> dict[str, str]:
+    owners: dict[str, set[str]] = {}
+    sources = [(alias, pid) for alias, pid in PROPERTY_ALIASES.items()]
+    sources += [(f"{p['name']} {p['city']}", pid) for pid, p in PROPERTIES.items()]
+    for text, pid in sources:
+        for word in _WORD_RE.findall(text.lower()):
+            owners.setdefault(word, set()).add(pid)
+    index = {word: next(iter(pids)) for word, pids in owners.items() if len(pids) == 1}
+    index.update(PROPERTY_ALIASES)
+    return index
+
+
+_ALIAS_INDEX = _build_alias_index()
+
+# Resolved lookups keyed by the raw tool argument. The catalog is static and
+# the model keeps passing the same few names, so each input is resolved once.
+# (A plain dict rather than lru_cache: this module is pickled by value for
+# Vertex, and lru_cache wrappers pickle by module reference.)
+_FIND_CACHE: dict[str, dict | None] = {}
+_FIND_CACHE_MAX = 256
+_MISSING = object()
+
 
 def _find_property(name_or_id: str) -> dict | None:
-    """Internal helper: resolve a property by ID or name alias."""
+    """Internal helper: resolve a property by ID or name alias (memoized)."""
+    prop = PROPERTIES.get(name_or_id)  # already a canonical PROP-XXX-NNN id
+    if prop is not None:
+        return prop
+    prop = _FIND_CACHE.get(name_or_id, _MISSING)
+    if prop is _MISSING:
+        prop = _resolve_property(name_or_id)
+        if len(_FIND_CACHE) >= _FIND_CACHE_MAX:
+            _FIND_CACHE.clear()
+        _FIND_CACHE[name_or_id] = prop
+    return prop
+
+
+def _resolve_property(name_or_id: str) -> dict | None:
     key = name_or_id.upper()
     if key in PROPERTIES:
         return PROPERTIES[key]
     lower = name_or_id.lower().strip()
-    prop_id = PROPERTY_ALIASES.get(lower)
+    prop_id = _ALIAS_INDEX.get(lower)
     if prop_id:
         return PROPERTIES.get(prop_id)
-    for alias, pid in PROPERTY_ALIASES.items():
-        if alias in lower or lower in alias:
-            return PROPERTIES.get(pid)
+    for word in _WORD_RE.findall(lower):
+        prop_id = _ALIAS_INDEX.get(word)
+        if prop_id:
+            return PROPERTIES.get(prop_id)
     return None
 
 
-def lookup_property(name_or_id: str) -> str:
-    """Get general information about a Stayforlong property. Accepts property ID (PROP-XXX-NNN) or city/name like 'Barcelona', 'Madrid', 'Lisboa', 'Gran Via', 'Salamanca', 'LX Factory'."""
-    prop = _find_property(name_or_id)
-    if not prop:
-        return json.dumps({
-            "found": False,
-            "message": (
-                f"Property '{name_or_id}' not found. "
-                "Available properties are: Barcelona (Gran Via), Madrid (Salamanca), Lisbon (LX Factory)."
-            ),
-        })
-    pid = prop["property_id"]
-    return json.dumps({
-        "found": True,
-        "property_id": pid,
-        "name": prop["name"],
-        "city": prop["city"],
-        "country": prop["country"],
-        "address": prop["address"],
-        "stars": prop["stars"],
-        "type": prop["type"],
-        "check_in_time": prop["check_in_time"],
-        "check_out_time": prop["check_out_time"],
-        "reception_hours": prop["reception_hours"],
-        "self_checkin": prop["self_checkin"],
-        "early_checkin_available": prop["early_checkin_available"],
-        "late_checkout_available": prop["late_checkout_available"],
-        "rating": prop["stayforlong_rating"],
-        "total_reviews": prop["total_reviews"],
-        "stayforlong_url": PROPERTY_URLS.get(pid, STAYFORLONG_BASE_URL),
-    })
+# (source field, response key) pairs for lookup_property, read in one C call.
+_LOOKUP_FIELDS = (
+    ("property_id", "property_id"),
+    ("name", "name"),
+    ("city", "city"),
+    ("country", "country"),
+    ("address", "address"),
+    ("stars", "stars"),
+    ("type", "type"),
+    ("check_in_time", "check_in_time"),
+    ("check_out_time", "check_out_time"),
+    ("reception_hours", "reception_hours"),
+    ("self_checkin", "self_checkin"),
+    ("early_checkin_available", "early_checkin_available"),
+    ("late_checkout_available", "late_checkout_available"),
+    ("stayforlong_rating", "rating"),
+    ("total_reviews", "total_reviews"),
+)
+_LOOKUP_KEYS = tuple(key for _, key in _LOOKUP_FIELDS)
+_LOOKUP_GETTER = itemgetter(*(src for src, _ in _LOOKUP_FIELDS))
 
 
-def get_property_amenities(property_id: str) -> str:
-    """Get the full list of amenities for a Stayforlong property. Accepts property ID or city name."""
-    prop = _find_property(property_id)
-    if not prop:
-        return json.dumps({"found": False, "message": f"Property '{property_id}' not found."})
+def _lookup_payload(prop: dict) -> dict:
+    values = _LOOKUP_GETTER(prop)
+    response = {"found": True}
+    response.update(zip(_LOOKUP_KEYS, values))
+    response["stayforlong_url"] = prop["stayforlong_url"]
+    return response
 
+
+def _amenities_payload(prop: dict) -> dict:
     amenities = prop["amenities"]
     summary = []
 
@@ -119,22 +164,15 @@ def get_property_amenities(property_id: str) -> str:
     if extras:
         summary.append("Other: " + ", ".join(extras))
 
-    pid = prop["property_id"]
-    return json.dumps({
+    return {
         "found": True,
         "property_name": prop["name"],
         "amenities_summary": summary,
-        "stayforlong_url": PROPERTY_URLS.get(pid, STAYFORLONG_BASE_URL),
-    })
-
+        "stayforlong_url": prop["stayforlong_url"],
+    }
 
-def get_checkin_info(property_id: str) -> str:
-    """Get check-in and check-out times and procedures for a property."""
-    prop = _find_property(property_id)
-    if not prop:
-        return json.dumps({"found": False, "message": f"Property '{property_id}' not found."})
 
-    pid = prop["property_id"]
+def _checkin_payload(prop: dict) -> dict:
     info = {
         "found": True,
         "property_name": prop["name"],
@@ -144,50 +182,89 @@ def get_checkin_info(property_id: str) -> str:
         "early_checkin_available": prop["early_checkin_available"],
         "late_checkout_available": prop["late_checkout_available"],
         "self_checkin": prop["self_checkin"],
-        "stayforlong_url": PROPERTY_URLS.get(pid, STAYFORLONG_BASE_URL),
+        "stayforlong_url": prop["stayforlong_url"],
     }
     if prop["self_checkin"] and prop.get("self_checkin_method"):
         info["self_checkin_method"] = prop["self_checkin_method"]
+    return info
 
-    return json.dumps(info)
+
+# Found-responses depend only on the (static) catalog, so they are serialized once.
+_LOOKUP_JSON: dict[str, str] = {pid: _dumps(_lookup_payload(p)) for pid, p in PROPERTIES.items()}
+_AMENITIES_JSON: dict[str, str] = {pid: _dumps(_amenities_payload(p)) for pid, p in PROPERTIES.items()}
+_CHECKIN_JSON: dict[str, str] = {pid: _dumps(_checkin_payload(p)) for pid, p in PROPERTIES.items()}
+
+
+def lookup_property(name_or_id: str) -> str:
+    """Get general information about a Stayforlong property. Accepts property ID (PROP-XXX-NNN) or city/name like 'Barcelona', 'Madrid', 'Lisboa', 'Gran Via', 'Salamanca', 'LX Factory'."""
+    prop = _find_property(name_or_id)
+    if not prop:
+        return _dumps({
+            "found": False,
+            "message": (
+                f"Property '{name_or_id}' not found. "
+                "Available properties are: Barcelona (Gran Via), Madrid (Salamanca), Lisbon (LX Factory)."
+            ),
+        })
+    return _LOOKUP_JSON[prop["property_id"]]
+
+
+def get_property_amenities(property_id: str) -> str:
+    """Get the full list of amenities for a Stayforlong property. Accepts property ID or city name."""
+    prop = _find_property(property_id)
+    if not prop:
+        return _dumps({"found": False, "message": f"Property '{property_id}' not found."})
+    return _AMENITIES_JSON[prop["property_id"]]
+
+
+def get_checkin_info(property_id: str) -> str:
+    """Get check-in and check-out times and procedures for a property."""
+    prop = _find_property(property_id)
+    if not prop:
+        return _dumps({"found": False, "message": f"Property '{property_id}' not found."})
+    return _CHECKIN_JSON[prop["property_id"]]
 
 
 _contact = STAYFORLONG_CONTACT
 
+_INSTRUCTION = (
+    "You are the accommodation specialist for Stayforlong, a long-stay apartment platform. "
+    "Always respond in the language the user writes in; default to {lang_name} if unclear. "
+    "You have been transferred from the main assistant — the user's question is already in the conversation. "
+    "NEVER greet the user or say 'Hola' / 'Hello' / 'How can I help' — go straight to answering.\n\n"
+
+    "SCOPE — what you handle:\n"
+    "✅ Property/accommodation general info: address, stars, type, ratings\n"
+    "✅ Amenities: WiFi, parking, gym, pool, kitchen, cleaning, pets policy\n"
+    "✅ Check-in/check-out times and procedures, self check-in instructions\n"
+    "✅ Reception hours, early check-in, late check-out availability\n\n"
+
+    "OUT OF SCOPE — call transfer_to_triage IMMEDIATELY, never attempt to answer:\n"
+    "🔄 Reservation details, booking status, prices, cancellation policies\n"
+    "🔄 Incidents, complaints, maintenance problems during stay\n\n"
+
+    "POLICY — MANDATORY:\n"
+    "• NEVER suggest the guest contact the property directly (no direct property phones or emails).\n"
+    "• Always refer guests to the Stayforlong listing page (stayforlong_url from tool results) "
+    "for more details or to manage their booking.\n"
+    "• If you cannot resolve the query, refer to Stayforlong support:\n"
+    f"  📞 {_contact['phone']}  |  ✉️ {_contact['email']}  |  {_contact['hours']}\n\n"
+
+    "Available properties: Gran Via (Barcelona), Residencia Salamanca (Madrid), "
+    "LX Factory Residences (Lisbon).\n\n"
+    "Use lookup_property for general info, get_property_amenities for amenities detail, "
+    "and get_checkin_info for arrival/departure procedures. "
+    "Always include the stayforlong_url in your response so the guest can see full details.\n\n"
+    "IMPORTANT: For ANYTHING outside your scope, call transfer_to_triage IMMEDIATELY."
+)
+
+_TOOLS = (lookup_property, get_property_amenities, get_checkin_info, transfer_to_triage)
+
 PLUGIN = AgentPlugin(
     name="Accommodations",
     routing_hint="Accommodation info, amenities, check-in/out times, facilities",
-    instruction=(
-        "You are the accommodation specialist for Stayforlong, a long-stay apartment platform. "
-        "Always respond in the language the user writes in; default to {lang_name} if unclear. "
-        "You have been transferred from the main assistant — the user's question is already in the conversation. "
-        "NEVER greet the user or say 'Hola' / 'Hello' / 'How can I help' — go straight to answering.\n\n"
-
-        "SCOPE — what you handle:\n"
-        "✅ Property/accommodation general info: address, stars, type, ratings\n"
-        "✅ Amenities: WiFi, parking, gym, pool, kitchen, cleaning, pets policy\n"
-        "✅ Check-in/check-out times and procedures, self check-in instructions\n"
-        "✅ Reception hours, early check-in, late check-out availability\n\n"
-
-        "OUT OF SCOPE — call transfer_to_triage IMMEDIATELY, never attempt to answer:\n"
-        "🔄 Reservation details, booking status, prices, cancellation policies\n"
-        "🔄 Incidents, complaints, maintenance problems during stay\n\n"
-
-        "POLICY — MANDATORY:\n"
-        "• NEVER suggest the guest contact the property directly (no direct property phones or emails).\n"
-        "• Always refer guests to the Stayforlong listing page (stayforlong_url from tool results) "
-        "for more details or to manage their booking.\n"
-        "• If you cannot resolve the query, refer to Stayforlong support:\n"
-        f"  📞 {_contact['phone']}  |  ✉️ {_contact['email']}  |  {_contact['hours']}\n\n"
-
-        "Available properties: Gran Via (Barcelona), Residencia Salamanca (Madrid), "
-        "LX Factory Residences (Lisbon).\n\n"
-        "Use lookup_property for general info, get_property_amenities for amenities detail, "
-        "and get_checkin_info for arrival/departure procedures. "
-        "Always include the stayforlong_url in your response so the guest can see full details.\n\n"
-        "IMPORTANT: For ANYTHING outside your scope, call transfer_to_triage IMMEDIATELY."
-    ),
+    instruction=_INSTRUCTION,
     model=config.GEMINI_MODEL,
     is_fallback=False,
-    get_tools=lambda: [lookup_property, get_property_amenities, get_checkin_info, transfer_to_triage],
+    get_tools=lambda: _TOOLS,
 )
@@ -1,21 +1,47 @@
-import json
-import uuid
+import secrets
+from dataclasses import asdict, dataclass
+import orjson
 from agents.utils import transfer_to_triage
-from mock_data.incidents import INCIDENTS, INCIDENT_CATEGORIES, runtime_incidents
+from mock_data.incidents import INCIDENTS, INCIDENT_CATEGORY_SET, runtime_incidents
 from agents.constants import STAYFORLONG_CONTACT
 import config
 from agents.plugin import AgentPlugin
 
 
+def _dumps(obj: dict) -> str:
+    return orjson.dumps(obj).decode()
+
+
+_HIGH_PRIORITY: frozenset[str] = frozenset({"maintenance", "safety", "access"})
+
+
+@dataclass(slots=True)
+class Ticket:
+    """A support ticket created during the session (kept in runtime_incidents)."""
+    ticket_id: str
+    booking_id: str
+    category: str
+    description: str
+    priority: str
+    status: str = "open"
+    created_at: str = "2024-02-15T10:00:00Z"
+    resolved_at: str | None = None
+    assigned_to: str | None = "Support Team"
+    notes: str | None = None
+
+
 def lookup_incident(ticket_id: str) -> str:
     """Look up an existing support ticket by ticket ID (format: INC-XXX)."""
-    ticket = INCIDENTS.get(ticket_id.upper()) or runtime_incidents.get(ticket_id.upper())
+    key = ticket_id.strip().upper()
+    ticket = INCIDENTS.get(key)
+    if ticket is None and (runtime := runtime_incidents.get(key)) is not None:
+        ticket = asdict(runtime)
     if not ticket:
-        return json.dumps({
+        return _dumps({
             "found": False,
             "message": f"Ticket '{ticket_id}' not found.",
         })
-    return json.dumps({
+    return _dumps({
         "found": True,
         "ticket_id": ticket["ticket_id"],
         "category": ticket["category"],
@@ -31,25 +57,20 @@ def lookup_incident(ticket_id: str) -> str:
 
 def create_incident(category: str, description: str, booking_id: str) -> str:
     """Create a new support ticket for an issue. Category must be one of: maintenance, noise, cleanliness, appliance, wifi, access, safety, billing, other."""
-    if category not in INCIDENT_CATEGORIES:
+    if category not in INCIDENT_CATEGORY_SET:
         category = "other"
 
-    ticket_id = f"INC-{str(uuid.uuid4())[:6].upper()}"
-    ticket = {
-        "ticket_id": ticket_id,
-        "booking_id": booking_id,
-        "category": category,
-        "description": description,
-        "status": "open",
-        "priority": "high" if category in ["maintenance", "safety", "access"] else "medium",
-        "created_at": "2024-02-15T10:00:00Z",
-        "resolved_at": None,
-        "assigned_to": "Support Team",
-        "notes": None,
-    }
+    ticket_id = f"INC-{secrets.token_hex(3).upper()}"
+    ticket = Ticket(
+        ticket_id=ticket_id,
+        booking_id=booking_id,
+        category=category,
+        description=description,
+        priority="high" if category in _HIGH_PRIORITY else "medium",
+    )
     runtime_incidents[ticket_id] = ticket
 
-    return json.dumps({
+    return _dumps({
         "created": True,
         "ticket_id": ticket_id,
         "category": category,
@@ -64,7 +85,7 @@ def create_incident(category: str, description: str, booking_id: str) -> str:
 
 def escalate_to_human(reason: str) -> str:
     """Escalate this conversation to a human Stayforlong agent when the issue cannot be resolved automatically."""
-    return json.dumps({
+    return _dumps({
         "escalated": True,
         "reason": reason,
         "message": (
@@ -79,35 +100,39 @@ def escalate_to_human(reason: str) -> str:
 
 _contact = STAYFORLONG_CONTACT
 
+_INSTRUCTION = (
+    "You are the support agent for Stayforlong. Always respond in the language the user writes in; default to {lang_name} if unclear. "
+    "You have been transferred from the main assistant — the user's question is already in the conversation. "
+    "NEVER greet the user or say 'Hola' / 'Hello' / 'How can I help' — go straight to answering.\n\n"
+
+    "SCOPE — what you handle:\n"
+    "✅ Incidents, problems during stay: maintenance, noise, cleanliness, appliances, WiFi issues\n"
+    "✅ Creating new support tickets\n"
+    "✅ Checking status of an existing ticket (INC-XXX)\n"
+    "✅ Escalating to a human agent\n\n"
+
+    "OUT OF SCOPE — call transfer_to_triage IMMEDIATELY, never attempt to answer:\n"
+    "🔄 Reservation details, booking status, prices, cancellation policies\n"
+    "🔄 Property amenities, hotel facilities, check-in/out times\n\n"
+
+    "Process for in-scope issues:\n"
+    "1. Listen with empathy and understand the problem.\n"
+    "2. If the guest mentions an existing ticket (INC-XXX), use lookup_incident to check status.\n"
+    "3. For a new issue, use create_incident to register it (ask for booking_id if not provided).\n"
+    "4. If the problem persists or the guest is very frustrated, use escalate_to_human.\n\n"
+
+    f"If you cannot resolve the issue or the guest requests human assistance, provide:\n"
+    f"  📞 {_contact['phone']}  |  ✉️ {_contact['email']}  |  {_contact['hours']}\n\n"
+    "IMPORTANT: For ANYTHING outside your scope, call transfer_to_triage IMMEDIATELY."
+)
+
+_TOOLS = (lookup_incident, create_incident, escalate_to_human, transfer_to_triage)
+
 PLUGIN = AgentPlugin(
     name="Support",
     routing_hint="Incidents, complaints, maintenance problems, issues during stay",
-    instruction=(
-        "You are the support agent for Stayforlong. Always respond in the language the user writes in; default to {lang_name} if unclear. "
-        "You have been transferred from the main assistant — the user's question is already in the conversation. "
-        "NEVER greet the user or say 'Hola' / 'Hello' / 'How can I help' — go straight to answering.\n\n"
-
-        "SCOPE — what you handle:\n"
-        "✅ Incidents, problems during stay: maintenance, noise, cleanliness, appliances, WiFi issues\n"
-        "✅ Creating new support tickets\n"
-        "✅ Checking status of an existing ticket (INC-XXX)\n"
-        "✅ Escalating to a human agent\n\n"
-
-        "OUT OF SCOPE — call transfer_to_triage IMMEDIATELY, never attempt to answer:\n"
-        "🔄 Reservation details, booking status, prices, cancellation policies\n"
-        "🔄 Property amenities, hotel facilities, check-in/out times\n\n"
-
-        "Process for in-scope issues:\n"
-        "1. Listen with empathy and understand the problem.\n"
-        "2. If the guest mentions an existing ticket (INC-XXX), use lookup_incident to check status.\n"
-        "3. For a new issue, use create_incident to register it (ask for booking_id if not provided).\n"
-        "4. If the problem persists or the guest is very frustrated, use escalate_to_human.\n\n"
-
-        f"If you cannot resolve the issue or the guest requests human assistance, provide:\n"
-        f"  📞 {_contact['phone']}  |  ✉️ {_contact['email']}  |  {_contact['hours']}\n\n"
-        "IMPORTANT: For ANYTHING outside your scope, call transfer_to_triage IMMEDIATELY."
-    ),
+    instruction=_INSTRUCTION,
     model=config.GEMINI_MODEL,
     is_fallback=False,
-    get_tools=lambda: [lookup_incident, create_incident, escalate_to_human, transfer_to_triage],
+    get_tools=lambda: _TOOLS,
 )
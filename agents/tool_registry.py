@@ -45,13 +45,24 @@ def _build_registry() -> dict[str, Callable]:
     }
 
 
+_REGISTRY: dict[str, Callable] | None = None
+
+
+def _registry() -> dict[str, Callable]:
+    """The tool registry, built on first use and shared afterwards. Treat as read-only."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = _build_registry()
+    return _REGISTRY
+
+
 def get_tools_for(tool_names: list[str]) -> list[Callable]:
     """
     Resolve tool names → callables.
     transfer_to_triage is always appended if not already in the list.
     Unknown names are skipped with a warning.
     """
-    registry = _build_registry()
+    registry = _registry()
     names = list(tool_names)
     if "transfer_to_triage" not in names:
         names.append("transfer_to_triage")
@@ -65,14 +76,22 @@ def get_tools_for(tool_names: list[str]) -> list[Callable]:
     return tools
 
 
+_TOOLS_METADATA: list[dict] | None = None
+
+
 def list_available_tools() -> list[dict]:
-    """Return metadata for all registered tools (used by GET /admin/api/agents/tools)."""
-    registry = _build_registry()
-    return [
-        {
-            "name": name,
-            "description": (fn.__doc__ or "").strip().split("\n")[0],
-            "always_included": name == "transfer_to_triage",
-        }
-        for name, fn in registry.items()
-    ]
+    """
+    Return metadata for all registered tools (used by GET /admin/api/agents/tools).
+    Computed once — the registry is static — so treat the result as read-only.
+    """
+    global _TOOLS_METADATA
+    if _TOOLS_METADATA is None:
+        _TOOLS_METADATA = [
+            {
+                "name": name,
+                "description": (fn.__doc__ or "").strip().partition("\n")[0],
+                "always_included": name == "transfer_to_triage",
+            }
+            for name, fn in _registry().items()
+        ]
+    return _TOOLS_METADATA
@@ -6,12 +6,15 @@ dynamically discovered by AgentLoader and builds the Triage LlmAgent
 with its sub_agents and the correct routing instruction.
 
 Called from adk_runner.py:
-    loader = AgentLoader()
+    loader = AgentLoader.get_instance()
     specialists, fallback = loader.build_agents()
     triage_agent = build_triage_agent(specialists, fallback)
 """
+from functools import cache
+
 from google.adk.agents import LlmAgent
 from agents.plugin import AgentPlugin
+from agents.utils import compile_instruction
 import config
 
 
@@ -32,9 +35,8 @@ def build_triage_agent(
     """
     fallback_plugin, fallback_agent = fallback
 
-    routing_bullets = "\n".join(
-        f"• {plugin.routing_hint} → transfer to {agent.name}"
-        for plugin, agent in specialists
+    routing_bullets = _compose_bullets(
+        tuple((plugin.routing_hint, agent.name) for plugin, agent in specialists)
     )
 
     instruction = _build_instruction(routing_bullets, fallback_agent.name)
@@ -42,11 +44,18 @@ def build_triage_agent(
     return LlmAgent(
         name="Triage",
         model=config.GEMINI_MODEL,
-        instruction=instruction,
+        instruction=compile_instruction(instruction),
         sub_agents=[agent for _, agent in specialists] + [fallback_agent],
     )
 
 
+@cache
+def _compose_bullets(routes: tuple[tuple[str, str], ...]) -> str:
+    """One routing bullet per (routing_hint, agent_name), memoized per specialist set."""
+    return "\n".join(f"• {hint} → transfer to {name}" for hint, name in routes)
+
+
+@cache
 def _build_instruction(routing_bullets: str, fallback_name: str) -> str:
     return (
         "You are the virtual assistant for Stayforlong, a long-stay apartment platform in Europe. "
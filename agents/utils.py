@@ -1,8 +1,34 @@
 """Shared utilities for all Stayforlong agents."""
+import re
+
 from google.adk.tools.tool_context import ToolContext
 
+# Same placeholder syntax ADK's session-state injection recognises.
+_PLACEHOLDER_RE = re.compile(r"{+[^{}]*}+")
+
+
+def compile_instruction(text: str):
+    """
+    Pre-split an instruction on {lang_name} so ADK doesn't regex-scan the whole
+    prompt on every turn. Returns an instruction provider that joins the parts
+    with the session's lang_name, or the text unchanged if it has no
+    {lang_name} or uses any other template placeholder.
+    """
+    parts = text.split("{lang_name}")
+    if len(parts) == 1 or any(_PLACEHOLDER_RE.search(p) for p in parts):
+        return text
+
+    def _instruction(ctx) -> str:
+        return ctx.state.get("lang_name", "English").join(parts)
+
+    return _instruction
+
+
+# Shared by every transfer; nothing downstream mutates a tool's result dict.
+_TRANSFERRED_RESPONSE = {"status": "transferred"}
+
 
 def transfer_to_triage(tool_context: ToolContext) -> dict:
     """Transfer the conversation back to the main Stayforlong assistant for a different topic."""
     tool_context.actions.transfer_to_agent = "Triage"
-    return {"status": "transferred"}
+    return _TRANSFERRED_RESPONSE
@@ -1,6 +1,9 @@
 import os
+import hashlib
 import json
 import tempfile
+from dataclasses import dataclass
+from pathlib import Path
 
 # In Vertex AI Agent Engine runtime, _vertex_env.py is bundled via extra_packages
 # and pre-sets os.environ with project/location/model values. Safe no-op locally.
@@ -9,82 +12,202 @@ try:
 except ImportError:
     pass
 
-from dotenv import load_dotenv
+# Only parse .env when one sits next to this file. Deployed containers get
+# their env vars from the platform, so they skip the file lookup entirely
+# (or opt out explicitly with SFL_SKIP_DOTENV=1).
+_envfile = Path(__file__).with_name(".env")
+if os.environ.get("SFL_SKIP_DOTENV") != "1" and _envfile.is_file():
+    from dotenv import load_dotenv
 
-load_dotenv()
+    load_dotenv(_envfile, override=False)
 
 # ── Railway / Cloud Run: GCP service account from env var ─────────────────────
 # Set GOOGLE_APPLICATION_CREDENTIALS_JSON to the full contents of your
 # service account JSON key (copy-paste the entire JSON as a single env var).
 # This writes it to a temp file and sets GOOGLE_APPLICATION_CREDENTIALS so
-# Google client libraries pick it up automatically.
+# Google client libraries pick it up automatically. The file name is derived
+# from a hash of the key, so restarts and sibling workers reuse one file.
 _sa_json = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS_JSON", "").strip()
 if _sa_json and not os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+    _sa_digest = hashlib.sha256(_sa_json.encode()).hexdigest()[:16]
+    _sa_path = Path(tempfile.gettempdir()) / f"gcp_sa_{_sa_digest}.json"
     try:
-        _sa_data = json.loads(_sa_json)
-        _sa_file = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False, prefix="gcp_sa_"
-        )
-        json.dump(_sa_data, _sa_file)
-        _sa_file.close()
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = _sa_file.name
+        if not _sa_path.is_file():
+            json.loads(_sa_json)  # validate once, before the key is written
+            _fd = os.open(_sa_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(_fd, "w") as _sa_file:
+                _sa_file.write(_sa_json)
+        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(_sa_path)
+    except FileExistsError:
+        # Another worker created it between the check and the open.
+        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(_sa_path)
     except Exception as _e:
         import logging as _logging
         _logging.getLogger(__name__).warning(
             "Failed to write GOOGLE_APPLICATION_CREDENTIALS_JSON to temp file: %s", _e
         )
 
-GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
+# ── Env parsing helpers ───────────────────────────────────────────────────────
+_TRUE = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def _env_bool(env, name: str, default: bool = False) -> bool:
+    value = env.get(name)
+    return default if value is None else value.lower() in _TRUE
+
+
+def _env_int(env, name: str, default: int) -> int:
+    value = env.get(name)
+    return default if value is None else int(value)
+
+
+def _env_float(env, name: str, default: float) -> float:
+    value = env.get(name)
+    return default if value is None else float(value)
+
 
 # Vertex AI — set GOOGLE_GENAI_USE_VERTEXAI=true to use Vertex instead of AI Studio
 # Also requires: GOOGLE_CLOUD_PROJECT and GOOGLE_CLOUD_LOCATION
 # Local auth: gcloud auth application-default login
 # Railway: set GOOGLE_APPLICATION_CREDENTIALS_JSON to the service account JSON content
-_use_vertex = os.environ.get("GOOGLE_GENAI_USE_VERTEXAI", "false").lower() == "true"
+_use_vertex = _env_bool(os.environ, "GOOGLE_GENAI_USE_VERTEXAI")
+# Changes are collected first and applied in one os.environ.update(), writing
+# only keys whose value actually changes.
+_env_updates: dict[str, str] = {}
 if _use_vertex:
-    os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "1"
-    os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "us-central1")
+    _env_updates["GOOGLE_GENAI_USE_VERTEXAI"] = "1"
+    if "GOOGLE_CLOUD_LOCATION" not in os.environ:
+        _env_updates["GOOGLE_CLOUD_LOCATION"] = "us-central1"
     # When using Vertex AI, do NOT set GOOGLE_API_KEY — having both project and
     # api_key causes BaseApiClient.__init__ to fail before _http_options is set,
     # producing AttributeError in aclose() cleanup tasks.
     os.environ.pop("GOOGLE_API_KEY", None)
 else:
     # AI Studio mode: map GEMINI_API_KEY → GOOGLE_API_KEY which ADK reads
-    GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
-    if GEMINI_API_KEY and not os.environ.get("GOOGLE_API_KEY"):
-        os.environ["GOOGLE_API_KEY"] = GEMINI_API_KEY
-
-# Exposed for health endpoint and diagnostics
-USE_VERTEX_AI = _use_vertex
-GOOGLE_CLOUD_PROJECT = os.environ.get("GOOGLE_CLOUD_PROJECT", "")
-GOOGLE_CLOUD_LOCATION = os.environ.get("GOOGLE_CLOUD_LOCATION", "us-central1")
-
-# Location for the Agent Engine (session storage). Defaults to GOOGLE_CLOUD_LOCATION.
-# Set AGENT_ENGINE_LOCATION to keep sessions in a different region than model calls
-# (e.g. europe-west1 for data residency while model runs in us-central1).
-AGENT_ENGINE_LOCATION = os.environ.get("AGENT_ENGINE_LOCATION", GOOGLE_CLOUD_LOCATION)
-
-# ── Vertex AI Search (Discovery Engine) ─────────────────────────────────────
-# Search engine ID for the Stayforlong Help Center Vertex AI Search index.
-# Format: just the engine ID (e.g. "stayforlong-help-center_1772048036019")
-# Get it from: https://console.cloud.google.com/gen-app-builder/engines
-VERTEX_AI_SEARCH_ENGINE_ID = os.environ.get("VERTEX_AI_SEARCH_ENGINE_ID", "")
-
-# ── Vertex AI Agent Engine (VertexAiSessionService) ──────────────────────────
-# Numeric resource ID of the Triage reasoning engine (session storage).
-# TRIAGE_ENGINE_ID is the canonical name; AGENT_ENGINE_ID is supported as alias.
-# Get it from: gcloud ai reasoning-engines list --location=LOCATION
-# If empty, falls back to InMemorySessionService (local dev without GCP)
-TRIAGE_ENGINE_ID = (
-    os.environ.get("TRIAGE_ENGINE_ID")
-    or os.environ.get("AGENT_ENGINE_ID", "")
-)
+    _api_key = os.environ.get("GEMINI_API_KEY", "")
+    if _api_key and not os.environ.get("GOOGLE_API_KEY"):
+        _env_updates["GOOGLE_API_KEY"] = _api_key
+_env_updates = {k: v for k, v in _env_updates.items() if os.environ.get(k) != v}
+if _env_updates:
+    os.environ.update(_env_updates)
+
+
+# ── Settings ──────────────────────────────────────────────────────────────────
+# Every value below is read once, from a single snapshot of os.environ taken
+# after the adjustments above. The module-level names at the bottom are
+# aliases kept for existing `config.X` call sites.
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    gemini_model: str
+    # Only set in AI Studio mode (no Vertex).
+    gemini_api_key: str
+    use_vertex_ai: bool
+    google_cloud_project: str
+    google_cloud_location: str
+
+    # Location for the Agent Engine (session storage). Defaults to GOOGLE_CLOUD_LOCATION.
+    # Set AGENT_ENGINE_LOCATION to keep sessions in a different region than model calls
+    # (e.g. europe-west1 for data residency while model runs in us-central1).
+    agent_engine_location: str
+
+    # ── Vertex AI Search (Discovery Engine) ──────────────────────────────────
+    # Search engine ID for the Stayforlong Help Center Vertex AI Search index.
+    # Format: just the engine ID (e.g. "stayforlong-help-center_1772048036019")
+    # Get it from: https://console.cloud.google.com/gen-app-builder/engines
+    vertex_ai_search_engine_id: str
+
+    # Hedged help-center searches: if a search hasn't answered after this many
+    # milliseconds, send one identical backup request and take whichever finishes
+    # first. Trims the tail latency at the cost of extra queries. 0 disables.
+    help_center_hedge_ms: int
+
+    # Deadline (seconds) passed to each help-center search RPC. gRPC cancels the
+    # call server-side when it expires instead of leaving the stream hanging.
+    help_center_timeout: float
+
+    # ── Vertex AI Agent Engine (VertexAiSessionService) ──────────────────────
+    # Numeric resource ID of the Triage reasoning engine (session storage).
+    # TRIAGE_ENGINE_ID is the canonical name; AGENT_ENGINE_ID is supported as alias.
+    # Get it from: gcloud ai reasoning-engines list --location=LOCATION
+    # If empty, falls back to InMemorySessionService (local dev without GCP)
+    triage_engine_id: str
+
+    # ── Vertex AI Agent Provisioning ─────────────────────────────────────────
+    # GCS bucket for staging agent artifacts when deploying to Vertex AI.
+    # Format: gs://your-bucket-name  (only required to run provision.py)
+    vertex_staging_bucket: str
+
+    # ── Conversation logging (Cloud Logging) ─────────────────────────────────
+    # Set CLOUD_LOGGING_ENABLED=false to disable (logs go nowhere).
+    # Uses GOOGLE_CLOUD_PROJECT for the log destination.
+    # Local dev: gcloud auth application-default login
+    cloud_logging_enabled: bool
+
+    # Log name written to Cloud Logging (under the GCP project)
+    cloud_logging_log_name: str
+
+    # How many hours back to look for a previous session to offer history recovery
+    history_recovery_hours: int
+
+    # ── Admin dashboard ──────────────────────────────────────────────────────
+    # Protect the /admin dashboard with a secret key.
+    # If empty, the dashboard is open (dev mode only — set a key in production!).
+    admin_api_key: str
+
+    # ── CORS ─────────────────────────────────────────────────────────────────
+    # Allowed origins from ADMIN_ORIGIN (where sfl-multi-agents-admin is hosted)
+    # and FRONTEND_ORIGIN (where sfl-multi-agents-chat widget/demo is hosted).
+    # Defaults to ("*",) when neither is set (local dev).
+    cors_origins: tuple[str, ...]
+
+
+def _load() -> Settings:
+    env = dict(os.environ)
+    location = env.get("GOOGLE_CLOUD_LOCATION", "us-central1")
+    origins = tuple(
+        o for o in (env.get("ADMIN_ORIGIN", "").strip(), env.get("FRONTEND_ORIGIN", "").strip()) if o
+    )
+    return Settings(
+        gemini_model=env.get("GEMINI_MODEL", "gemini-2.5-flash"),
+        gemini_api_key="" if _use_vertex else env.get("GEMINI_API_KEY", ""),
+        use_vertex_ai=_use_vertex,
+        google_cloud_project=env.get("GOOGLE_CLOUD_PROJECT", ""),
+        google_cloud_location=location,
+        agent_engine_location=env.get("AGENT_ENGINE_LOCATION", location),
+        vertex_ai_search_engine_id=env.get("VERTEX_AI_SEARCH_ENGINE_ID", ""),
+        help_center_hedge_ms=_env_int(env, "HELP_CENTER_HEDGE_MS", 0),
+        help_center_timeout=_env_float(env, "HELP_CENTER_TIMEOUT", 8.0),
+        triage_engine_id=env.get("TRIAGE_ENGINE_ID") or env.get("AGENT_ENGINE_ID", ""),
+        vertex_staging_bucket=env.get("VERTEX_STAGING_BUCKET", ""),
+        cloud_logging_enabled=_env_bool(env, "CLOUD_LOGGING_ENABLED", True),
+        cloud_logging_log_name=env.get("CLOUD_LOGGING_LOG_NAME", "stayforlong-conversations"),
+        history_recovery_hours=_env_int(env, "HISTORY_RECOVERY_HOURS", 48),
+        admin_api_key=env.get("ADMIN_API_KEY", ""),
+        cors_origins=origins or ("*",),
+    )
+
+
+settings = _load()
+
+# ── Module-level aliases ──────────────────────────────────────────────────────
+GEMINI_MODEL = settings.gemini_model
+GEMINI_API_KEY = settings.gemini_api_key
+USE_VERTEX_AI = settings.use_vertex_ai
+GOOGLE_CLOUD_PROJECT = settings.google_cloud_project
+GOOGLE_CLOUD_LOCATION = settings.google_cloud_location
+AGENT_ENGINE_LOCATION = settings.agent_engine_location
+VERTEX_AI_SEARCH_ENGINE_ID = settings.vertex_ai_search_engine_id
+HELP_CENTER_HEDGE_MS = settings.help_center_hedge_ms
+HELP_CENTER_TIMEOUT = settings.help_center_timeout
+TRIAGE_ENGINE_ID = settings.triage_engine_id
 AGENT_ENGINE_ID = TRIAGE_ENGINE_ID  # backward-compat alias
-
-# ── Vertex AI Agent Provisioning ─────────────────────────────────────────────
-# GCS bucket for staging agent artifacts when deploying to Vertex AI.
-# Format: gs://your-bucket-name  (only required to run provision.py)
-VERTEX_STAGING_BUCKET = os.environ.get("VERTEX_STAGING_BUCKET", "")
+VERTEX_STAGING_BUCKET = settings.vertex_staging_bucket
+CLOUD_LOGGING_ENABLED = settings.cloud_logging_enabled
+CLOUD_LOGGING_LOG_NAME = settings.cloud_logging_log_name
+HISTORY_RECOVERY_HOURS = settings.history_recovery_hours
+ADMIN_API_KEY = settings.admin_api_key
+CORS_ORIGINS: tuple[str, ...] = settings.cors_origins
 
 # Python packages bundled when deploying agent plugins to Vertex AI Reasoning Engine.
 VERTEX_AGENT_REQUIREMENTS = [
@@ -93,31 +216,5 @@ VERTEX_AGENT_REQUIREMENTS = [
     "google-cloud-logging>=3.0.0",
     "python-dotenv>=1.0.0",
     "pydantic>=2.0.0",
+    "orjson>=3.9.0",
 ]
-
-# ── Conversation logging (Cloud Logging) ─────────────────────────────────────
-# Set CLOUD_LOGGING_ENABLED=false to disable (logs go nowhere).
-# Uses GOOGLE_CLOUD_PROJECT for the log destination.
-# Local dev: gcloud auth application-default login
-CLOUD_LOGGING_ENABLED = os.environ.get("CLOUD_LOGGING_ENABLED", "true").lower() == "true"
-
-# Log name written to Cloud Logging (under the GCP project)
-CLOUD_LOGGING_LOG_NAME = os.environ.get("CLOUD_LOGGING_LOG_NAME", "stayforlong-conversations")
-
-# How many hours back to look for a previous session to offer history recovery
-HISTORY_RECOVERY_HOURS = int(os.environ.get("HISTORY_RECOVERY_HOURS", "48"))
-
-# ── Admin dashboard ───────────────────────────────────────────────────────────
-# Protect the /admin dashboard with a secret key.
-# If empty, the dashboard is open (dev mode only — set a key in production!).
-ADMIN_API_KEY = os.environ.get("ADMIN_API_KEY", "")
-
-# ── CORS ──────────────────────────────────────────────────────────────────────
-# Comma-separated list of allowed origins.
-# ADMIN_ORIGIN: URL where sfl-multi-agents-admin is hosted.
-# FRONTEND_ORIGIN: URL where sfl-multi-agents-chat widget/demo is hosted.
-# Defaults to ["*"] when neither is set (local dev).
-_admin_origin = os.environ.get("ADMIN_ORIGIN", "")
-_frontend_origin = os.environ.get("FRONTEND_ORIGIN", "")
-_explicit_origins = [o.strip() for o in [_admin_origin, _frontend_origin] if o.strip()]
-CORS_ORIGINS: list[str] = _explicit_origins if _explicit_origins else ["*"]
@@ -1,9 +1,13 @@
 import asyncio
+import importlib
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from contextlib import asynccontextmanager
+from urllib.parse import parse_qsl
+import orjson
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from ws.handler import websocket_endpoint
+from fastapi.responses import Response
 from admin.router import router as admin_router
 import config  # Must be imported first to set env vars before ADK initializes
 
@@ -36,10 +40,79 @@ logging.getLogger("google_genai").setLevel(logging.WARNING)
 logging.getLogger("google_adk").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# ── Startup / shutdown ────────────────────────────────────────────────────────
+# Background thread jobs started at boot. References are held here so the
+# tasks are not garbage-collected before they finish.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _run_in_background(func, *args) -> asyncio.Task:
+    task = asyncio.create_task(asyncio.to_thread(func, *args))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+# State of the chat-stack warm-up, reported by /health: "loading" until the
+# import finishes, then "ready" or "failed".
+_chat_stack = "loading"
+
+
+def _on_chat_stack_loaded(task: asyncio.Task) -> None:
+    global _chat_stack
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        _chat_stack = "failed"
+        logger.error("Chat stack failed to load; /ws is unavailable.", exc_info=exc)
+    else:
+        _chat_stack = "ready"
+
+
+# Provisioning can run for minutes while it deploys, so it gets its own daemon
+# thread: the loop's default executor is joined on shutdown, a daemon is not.
+_provision_started = False
+
+
+def _provision() -> None:
+    from orchestrator.provision import provision_on_startup
+    provision_on_startup()
+
+
+def _start_provision() -> None:
+    global _provision_started
+    if _provision_started:
+        return
+    _provision_started = True
+    threading.Thread(target=_provision, name="provision", daemon=True).start()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts background work on server startup without blocking request handling:
+
+    - Imports the chat stack (ADK, google-genai) in a worker thread, so the
+      server starts without it and the first chat does not pay for the import.
+    - Provisions agents on Vertex AI. Fast-path: if all agents are already
+      registered this completes in ~2s without any deployment. Silently
+      skipped if GOOGLE_CLOUD_PROJECT or VERTEX_STAGING_BUCKET are not
+      configured (local dev without GCP).
+    """
+    _run_in_background(importlib.import_module, "ws.handler").add_done_callback(
+        _on_chat_stack_loaded
+    )
+    if config.GOOGLE_CLOUD_PROJECT and config.VERTEX_STAGING_BUCKET:
+        _start_provision()
+    yield
+
+
 app = FastAPI(
     title="Stayforlong Chat PoC",
     description="Multi-agent AI chat for Stayforlong customer support",
     version="0.3.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -51,51 +124,50 @@ app.add_middleware(
 
 app.include_router(admin_router)
 
-# Thread pool for running blocking provision tasks without blocking the event loop
-_provision_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="provision")
-
-
-@app.on_event("startup")
-async def startup_provision():
-    """
-    Provisions agents on Vertex AI in the background on server startup.
-
-    Fast-path: if all agents are already registered the function completes
-    in ~2s without any deployment. Does not block request handling.
-    Silently skipped if GOOGLE_CLOUD_PROJECT or VERTEX_STAGING_BUCKET
-    are not configured (local dev without GCP).
-    """
-    if not config.GOOGLE_CLOUD_PROJECT or not config.VERTEX_STAGING_BUCKET:
-        return
-
-    loop = asyncio.get_event_loop()
-
-    def _provision():
-        from orchestrator.provision import run_provision
-        run_provision(force=False)
-
-    loop.run_in_executor(_provision_executor, _provision)
-
 
 @app.websocket("/ws")
 async def ws_route(websocket: WebSocket):
-    lang    = websocket.query_params.get("lang", "en")[:2].lower()
-    user_id = websocket.query_params.get("user_id", "").strip()
+    from ws.handler import websocket_endpoint  # cached after first import
+
+    # Only two known keys: parse the raw query string directly instead of
+    # building Starlette's QueryParams multidict for every connection.
+    params  = dict(parse_qsl(websocket.scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True))
+    lang    = params.get("lang", "en")[:2].lower()
+    user_id = params.get("user_id", "").strip()
     await websocket_endpoint(websocket, lang, user_id)
 
 
+# Everything else /health reports is fixed at import, so one body per
+# chat-stack state is serialized up front. A failed warm-up answers 503 so
+# the platform healthcheck does not promote a deploy that cannot chat.
+_settings = config.settings
+_HEALTH = {
+    "status": "ok",
+    "model": _settings.gemini_model,
+    "backend": "vertex_ai" if _settings.use_vertex_ai else "ai_studio",
+    "project": _settings.google_cloud_project if _settings.use_vertex_ai else None,
+    "api_key_configured": bool(_settings.gemini_api_key),
+    "cloud_logging_enabled": _settings.cloud_logging_enabled,
+    "triage_engine_id": _settings.triage_engine_id or None,
+    "agent_engine_location": _settings.agent_engine_location,
+}
+_HEALTH_BODIES = {
+    state: orjson.dumps({
+        **_HEALTH,
+        "status": "error" if state == "failed" else "ok",
+        "chat_stack": state,
+    })
+    for state in ("loading", "ready", "failed")
+}
+
+
 @app.get("/health")
 async def health():
-    return {
-        "status": "ok",
-        "model": config.GEMINI_MODEL,
-        "backend": "vertex_ai" if config.USE_VERTEX_AI else "ai_studio",
-        "project": config.GOOGLE_CLOUD_PROJECT if config.USE_VERTEX_AI else None,
-        "api_key_configured": bool(getattr(config, "GEMINI_API_KEY", "")),
-        "cloud_logging_enabled": config.CLOUD_LOGGING_ENABLED,
-        "triage_engine_id": config.TRIAGE_ENGINE_ID or None,
-        "agent_engine_location": config.AGENT_ENGINE_LOCATION,
-    }
+    return Response(
+        content=_HEALTH_BODIES[_chat_stack],
+        status_code=503 if _chat_stack == "failed" else 200,
+        media_type="application/json",
+    )
 
 
 @app.get("/")
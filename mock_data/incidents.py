@@ -1,4 +1,6 @@
-INCIDENTS = {
+from types import MappingProxyType
+
+_INCIDENTS = {
     "INC-001": {
         "ticket_id": "INC-001",
         "booking_id": "SFL-2024-002",
@@ -25,7 +27,10 @@ INCIDENTS = {
     },
 }
 
-INCIDENT_CATEGORIES = [
+# Seed tickets are read-only lookup data.
+INCIDENTS = MappingProxyType({tid: MappingProxyType(t) for tid, t in _INCIDENTS.items()})
+
+INCIDENT_CATEGORIES = (
     "maintenance",
     "noise",
     "cleanliness",
@@ -35,7 +40,8 @@ INCIDENT_CATEGORIES = [
     "safety",
     "billing",
     "other",
-]
+)
+INCIDENT_CATEGORY_SET = frozenset(INCIDENT_CATEGORIES)
 
 # In-memory store for newly created incidents during the session
 runtime_incidents: dict = {}
@@ -55,7 +55,10 @@ RESERVATIONS = {
     },
 }
 
-EMAIL_INDEX = {r["email"]: r for r in RESERVATIONS.values()}
+# Index keys are stored in canonical form (booking IDs upper-case, emails
+# lower-case and stripped) so tool lookups are a single dict probe.
+RESERVATIONS = {k.upper(): v for k, v in RESERVATIONS.items()}
+EMAIL_INDEX = {r["email"].lower().strip(): r for r in RESERVATIONS.values()}
 
 CANCELLATION_POLICIES = {
     "flexible": "Free cancellation up to 5 days before check-in. After that: 50% refund.",
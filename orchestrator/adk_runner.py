@@ -59,11 +59,10 @@ def rebuild_runner() -> None:
     """
     global _runner
     from orchestrator.agent_loader import AgentLoader
-    from agents.triage import build_triage_agent
+    from orchestrator.root import build_root_agent
 
-    loader = AgentLoader()
-    specialists, fallback = loader.build_agents_merged()
-    new_root = build_triage_agent(specialists, fallback)
+    AgentLoader.get_instance().reload()  # pick up new or previously broken specialist files
+    new_root = build_root_agent()
 
     new_runner = Runner(
         agent=new_root,
@@ -4,21 +4,27 @@ AgentLoader — dynamically discovers and builds specialist agents.
 Scans agents/specialists/ for modules that export PLUGIN: AgentPlugin
 and builds LlmAgent objects from them.
 
-Usage in adk_runner.py:
-    loader = AgentLoader()
-    specialists, fallback = loader.build_agents()
+Usage in orchestrator/root.py:
+    loader = AgentLoader.get_instance()
+    specialists, fallback = loader.build_agents_merged()
     triage = build_triage_agent(specialists, fallback)
 
 Usage in provision.py:
-    loader = AgentLoader()
+    loader = AgentLoader.get_instance()
     plugins = loader.get_plugins()  # metadata only, no LlmAgent construction
+
+get_instance() returns one loader per process, so Python-source plugins are
+discovered and imported once. rebuild_runner() calls reload() to pick up new
+specialist files and retry modules that failed to import.
 """
 import importlib
 import pkgutil
 import logging
+import threading
 from pathlib import Path
 from google.adk.agents import LlmAgent
 from agents.plugin import AgentPlugin
+from agents.utils import compile_instruction
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +34,22 @@ class AgentLoader:
 
     _SPECIALISTS_PACKAGE = "agents.specialists"
 
+    _instance: "AgentLoader | None" = None
+    _instance_lock = threading.Lock()
+
     def __init__(self):
         self._plugins: list[AgentPlugin] = []
         self._loaded = False
+        self._load_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "AgentLoader":
+        """Process-wide loader, created on first call and shared afterwards."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
 
     # ── Public API ─────────────────────────────────────────────────────────────
 
@@ -54,8 +73,8 @@ class AgentLoader:
             agent = LlmAgent(
                 name=plugin.name,
                 model=plugin.model,
-                instruction=plugin.instruction,
-                tools=plugin.get_tools(),
+                instruction=compile_instruction(plugin.instruction),
+                tools=list(plugin.get_tools()),
             )
             if plugin.is_fallback:
                 fallback = (plugin, agent)
@@ -74,18 +93,37 @@ class AgentLoader:
     def _ensure_loaded(self) -> None:
         if self._loaded:
             return
-        self._load_plugins()
-        self._validate()
+        # Shared instance: admin rebuilds and provisioning may race on first load.
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._swap_in(self._load_plugins())
+
+    def reload(self) -> None:
+        """
+        Rediscover agents/specialists/: picks up new modules and retries ones
+        that failed to import. Modules already imported are not re-executed.
+        On a validation error the previously loaded plugins stay in place.
+        """
+        importlib.invalidate_caches()
+        with self._load_lock:
+            self._swap_in(self._load_plugins())
+
+    def _swap_in(self, plugins: list[AgentPlugin]) -> None:
+        """Validate a freshly loaded plugin list, then publish it. Caller holds _load_lock."""
+        self._validate(plugins)
+        self._plugins = plugins
         self._loaded = True
 
-    def _load_plugins(self) -> None:
+    def _load_plugins(self) -> list[AgentPlugin]:
+        plugins: list[AgentPlugin] = []
         package_path = Path(__file__).parent.parent / "agents" / "specialists"
         for _finder, module_name, _is_pkg in pkgutil.iter_modules([str(package_path)]):
             full_name = f"{self._SPECIALISTS_PACKAGE}.{module_name}"
             try:
                 mod = importlib.import_module(full_name)
                 if hasattr(mod, "PLUGIN") and isinstance(mod.PLUGIN, AgentPlugin):
-                    self._plugins.append(mod.PLUGIN)
+                    plugins.append(mod.PLUGIN)
                     logger.info(
                         "Loaded agent plugin: %s (fallback=%s)",
                         mod.PLUGIN.name,
@@ -98,6 +136,7 @@ class AgentLoader:
                     )
             except Exception:
                 logger.exception("Error loading plugin %s", full_name)
+        return plugins
 
     def build_agents_merged(
         self,
@@ -136,12 +175,12 @@ class AgentLoader:
             if "tools" in override:
                 tools = get_tools_for(override["tools"])
             else:
-                tools = plugin.get_tools()
+                tools = list(plugin.get_tools())
 
             agent = LlmAgent(
                 name=plugin.name,
                 model=model,
-                instruction=instruction,
+                instruction=compile_instruction(instruction),
                 tools=tools,
             )
             if is_fallback:
@@ -165,7 +204,7 @@ class AgentLoader:
             agent = LlmAgent(
                 name=synthetic_plugin.name,
                 model=synthetic_plugin.model,
-                instruction=synthetic_plugin.instruction,
+                instruction=compile_instruction(synthetic_plugin.instruction),
                 tools=tools,
             )
             if synthetic_plugin.is_fallback:
@@ -175,8 +214,8 @@ class AgentLoader:
 
         return specialists, fallback  # type: ignore[return-value]
 
-    def _validate(self) -> None:
-        fallbacks = [p for p in self._plugins if p.is_fallback]
+    def _validate(self, plugins: list[AgentPlugin]) -> None:
+        fallbacks = [p for p in plugins if p.is_fallback]
         if len(fallbacks) != 1:
             raise ValueError(
                 f"Expected exactly 1 plugin with is_fallback=True, "
@@ -185,7 +224,7 @@ class AgentLoader:
                 f"PLUGIN = AgentPlugin(..., is_fallback=True)."
             )
 
-        names = [p.name for p in self._plugins]
+        names = [p.name for p in plugins]
         seen: set[str] = set()
         duplicates = [n for n in names if n in seen or seen.add(n)]  # type: ignore[func-returns-value]
         if duplicates:
@@ -31,12 +31,23 @@ PREREQUISITES:
 
 AUTO-STARTUP (main.py):
   Called in the background on server start — creates the resource if it does not exist.
-  If already deployed, completes in ~2s with no action.
+  If already deployed, completes in ~2s with no action. Workers that start within
+  10 minutes of a successful check reuse its result (see provision_on_startup).
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 import argparse
+import hashlib
 import sys
 import logging
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no inter-worker lock, marker still applies
+    fcntl = None
+
 import config
 from orchestrator.vertex_registry import VertexRegistry
 
@@ -138,16 +149,18 @@ def cmd_delete() -> None:
         print("\n⚠️  System not found in Vertex AI.\n")
 
 
-def run_provision(force: bool = False) -> None:
+def run_provision(force: bool = False) -> bool:
     """
     Main provisioning flow (called from app startup and CLI).
 
     Args:
         force: If True, redeploys even if the system already exists (--force).
                If False (default), only deploys if the system does not exist.
+
+    Returns True when the system is deployed (already or now), False otherwise.
     """
     if not _check_config():
-        return
+        return False
 
     from agent import root_agent
 
@@ -161,7 +174,7 @@ def run_provision(force: bool = False) -> None:
                 existing.display_name,
                 existing.numeric_id,
             )
-            return
+            return True
 
     action = "Updating" if force else "Deploying"
     logger.info("%s multi-agent system on Vertex AI...", action)
@@ -173,9 +186,39 @@ def run_provision(force: bool = False) -> None:
             resource = registry.deploy_system(root_agent, config.VERTEX_STAGING_BUCKET)
     except Exception:
         logger.exception("Error deploying system to Vertex AI")
-        return
+        return False
 
     _print_summary(resource)
+    return True
+
+
+# ── Startup entrypoint ────────────────────────────────────────────────────────
+# Every uvicorn worker runs this on boot. A marker file records a recent
+# successful check for this project/bucket/model, and an exclusive file lock
+# makes sibling workers wait for the one doing the real Vertex call, then
+# reuse its result instead of repeating it.
+
+_STARTUP_MARKER_TTL = 600  # seconds
+
+
+def provision_on_startup() -> None:
+    """run_provision(force=False), skipped if a sibling worker did it recently."""
+    key = hashlib.sha256(
+        f"{config.GOOGLE_CLOUD_PROJECT}|{config.VERTEX_STAGING_BUCKET}|{config.GEMINI_MODEL}".encode()
+    ).hexdigest()[:16]
+    marker = Path(tempfile.gettempdir()) / f"sfl_prov_{key}"
+    with open(marker.with_suffix(".lock"), "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if marker.exists() and time.time() - marker.stat().st_mtime < _STARTUP_MARKER_TTL:
+                logger.info("System provisioned recently by another worker — skipping check.")
+                return
+            if run_provision(force=False):
+                marker.touch()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
 
 
 def _print_summary(resource) -> None:
@@ -0,0 +1,30 @@
+"""
+Root agent factory — one Triage tree per process.
+
+agent.py (ADK entrypoint), adk_runner.py and provision.py all need the same
+root_agent. Building it here behind lru_cache means the specialists are
+wired once no matter how many modules import it.
+
+    from orchestrator.root import get_root_agent
+    root_agent = get_root_agent()
+
+rebuild_runner() uses build_root_agent() directly to get a fresh tree after
+admin edits.
+"""
+from functools import lru_cache
+
+import config  # noqa: F401 — must be imported before ADK initializes
+from agents.triage import build_triage_agent
+from orchestrator.agent_loader import AgentLoader
+
+
+def build_root_agent():
+    """Build a new Triage root agent from the merged Python + GCS agent set."""
+    specialists, fallback = AgentLoader.get_instance().build_agents_merged()
+    return build_triage_agent(specialists, fallback)
+
+
+@lru_cache(maxsize=1)
+def get_root_agent():
+    """Process-wide root agent, built on first call and shared afterwards."""
+    return build_root_agent()
@@ -27,6 +27,7 @@ CLOUD_LOGGING_ENABLED=false. The rest of the app continues unaffected.
 
 import asyncio
 import uuid
+from itertools import islice
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional
@@ -76,6 +77,11 @@ def _log_name() -> str:
     )
 
 
+def _quoted(value: str) -> str:
+    """value as a Cloud Logging filter string literal, with \\ and " escaped."""
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
 # ── Serializers ───────────────────────────────────────────────────────────────
 
 def _ts_to_iso(value) -> Optional[str]:
@@ -252,9 +258,39 @@ class ConversationLogger:
         date_to: Optional[str] = None,
         agent: Optional[str] = None,
         tag: Optional[str] = None,
+        status: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> list[dict]:
+        """List conversations ordered newest-first. See list_conversations_paged()."""
+        page = await self.list_conversations_paged(
+            user_id=user_id,
+            limit=limit,
+            cursor=cursor,
+            date_from=date_from,
+            date_to=date_to,
+            agent=agent,
+            tag=tag,
+            status=status,
+            language=language,
+        )
+        return page["items"]
+
+    async def list_conversations_paged(
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,       # page_token from Cloud Logging
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        agent: Optional[str] = None,
+        tag: Optional[str] = None,
+        status: Optional[str] = None,
+        language: Optional[str] = None,
     ) -> dict:
         """
-        List conversations ordered newest-first.
+        List conversations ordered newest-first, with pagination metadata.
+        language is applied in the Cloud Logging filter (indexed label);
+        status, agent and tag are applied while enriching, before the limit.
         Returns {"items": [...], "next_cursor": page_token | None}.
         """
         cl_client, _cl = _get_cl()
@@ -268,14 +304,16 @@ class ConversationLogger:
                 'jsonPayload.event_type="conversation_start"',
             ]
             if user_id:
-                filters.append(f'labels.user_id="{user_id}"')
+                filters.append(f'labels.user_id={_quoted(user_id)}')
+            if language:
+                filters.append(f'labels.language={_quoted(language)}')
             if date_from:
-                filters.append(f'timestamp >= "{date_from}"')
+                filters.append(f'timestamp >= {_quoted(date_from)}')
             if date_to:
-                filters.append(f'timestamp <= "{date_to}"')
+                filters.append(f'timestamp <= {_quoted(date_to)}')
 
             filter_str = " AND ".join(filters)
-            fetch_limit = limit * 4 if (agent or tag) else limit + 1
+            fetch_limit = limit * 4 if (agent or tag or status) else limit + 1
 
             page_iter = cl_client.list_entries(
                 filter_=filter_str,
@@ -310,6 +348,8 @@ class ConversationLogger:
                     continue
                 if tag and tag not in (c.get("tags") or []):
                     continue
+                if status and c.get("status") != status:
+                    continue
                 items.append(c)
                 if len(items) >= limit:
                     break
@@ -320,7 +360,7 @@ class ConversationLogger:
             )
             return {"items": items[:limit], "next_cursor": next_cursor}
         except Exception as exc:
-            logger.error("list_conversations: %s", exc)
+            logger.error("list_conversations_paged: %s", exc)
             return {"items": [], "next_cursor": None}
 
     async def get_conversation(self, conv_id: str) -> Optional[dict]:
@@ -393,6 +433,40 @@ class ConversationLogger:
             logger.error("get_conversation_messages(%s): %s", conv_id, exc)
             return []
 
+    async def iter_conversation_messages(self, conv_id: str, limit: int = 100):
+        """
+        Async generator over a conversation's messages, oldest-first.
+        Pulls one batch of entries at a time off the event loop, so the first
+        messages can be sent before the whole thread is loaded.
+        (list_entries() returns a plain generator that fetches pages lazily,
+        not a pager with .pages.) Like get_conversation_messages, limit is
+        the page size: the whole thread is returned.
+        """
+        cl_client, _cl = _get_cl()
+        if not cl_client:
+            return
+        try:
+            from google.cloud import logging as cloud_logging  # noqa: PLC0415
+
+            batch_size = limit
+            entries = cl_client.list_entries(
+                filter_=(
+                    f'logName="{_log_name()}"'
+                    f' AND jsonPayload.event_type="message"'
+                    f' AND labels.conversation_id="{conv_id}"'
+                ),
+                order_by=cloud_logging.ASCENDING,
+                page_size=batch_size,
+            )
+            while True:
+                batch = await asyncio.to_thread(list, islice(entries, batch_size))
+                if not batch:
+                    return
+                for e in batch:
+                    yield _entry_to_msg(e)
+        except Exception as exc:
+            logger.error("iter_conversation_messages(%s): %s", conv_id, exc)
+
     async def get_stats(self) -> dict:
         cl_client, _cl = _get_cl()
         if not cl_client:
@@ -476,19 +550,15 @@ class ConversationLogger:
         tag: Optional[str] = None,
         limit: int = 1000,
     ) -> list[dict]:
-        result = await self.list_conversations(
+        return await self.list_conversations(
             limit=limit,
             date_from=date_from,
             date_to=date_to,
             agent=agent,
             tag=tag,
+            status=status,
+            language=language,
         )
-        items = result["items"]
-        if status:
-            items = [c for c in items if c.get("status") == status]
-        if language:
-            items = [c for c in items if c.get("language") == language]
-        return items
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
@@ -0,0 +1,83 @@
+"""
+lookup_reservation guest-name verification.
+
+A name verifies when it shares at least two whole tokens with the stored
+name (or every token of a single-token name), ignoring case, accents and
+token order.
+"""
+import orjson
+import pytest
+
+pytest.importorskip("google.adk")
+from agents.specialists import booking  # noqa: E402
+
+BOOKING_ID = "SFL-TEST-001"
+
+
+@pytest.fixture
+def reservation(monkeypatch):
+    """Registers a reservation for the given stored guest name."""
+    def _make(guest_name: str) -> str:
+        base = next(iter(booking.RESERVATIONS.values()))
+        monkeypatch.setitem(
+            booking.RESERVATIONS,
+            BOOKING_ID,
+            {**base, "booking_id": BOOKING_ID, "guest_name": guest_name},
+        )
+        return BOOKING_ID
+    return _make
+
+
+def _verified(booking_id: str, guest_name: str) -> bool:
+    result = orjson.loads(booking.lookup_reservation(booking_id, guest_name))
+    return result["identity_verified"]
+
+
+@pytest.mark.parametrize("stored, given", [
+    ("José Pérez", "Jose Perez"),
+    ("Jose Perez", "José Pérez"),
+    ("José Pérez", "JOSÉ PÉREZ"),
+])
+def test_accents_and_case_are_ignored(reservation, stored, given):
+    assert _verified(reservation(stored), given)
+
+
+def test_single_token_stored_name(reservation):
+    booking_id = reservation("Madonna")
+
+    assert _verified(booking_id, "madonna")
+    assert not _verified(booking_id, "Madison")
+
+
+def test_surname_only_does_not_verify_two_token_name(reservation):
+    assert not _verified(reservation("Joanna Smith"), "Smith")
+
+
+def test_partial_token_does_not_verify(reservation):
+    assert not _verified(reservation("Joanna Smith"), "Ann")
+
+
+@pytest.mark.parametrize("given", ["   ", "\t\n"])
+def test_whitespace_only_name_does_not_verify(reservation, given):
+    assert not _verified(reservation("Joanna Smith"), given)
+
+
+def test_empty_name_returns_public_info_only(reservation):
+    result = orjson.loads(booking.lookup_reservation(reservation("Joanna Smith"), ""))
+
+    assert "identity_verified" not in result
+    assert "guest_name" not in result
+
+
+def test_reordered_tokens_verify(reservation):
+    booking_id = reservation("Joanna Smith")
+
+    assert _verified(booking_id, "Smith Joanna")
+    assert _verified(booking_id, "  smith   JOANNA ")
+
+
+def test_verified_lookup_returns_full_details(reservation):
+    result = orjson.loads(booking.lookup_reservation(reservation("Joanna Smith"), "Joanna Smith"))
+
+    assert result["guest_name"] == "Joanna Smith"
+    assert "payment_status" in result
@@ -0,0 +1,105 @@
+"""
+ConversationLogger read paths against the real google-cloud-logging client.
+
+Only the HTTP connection is faked, so Client.list_entries() returns the same
+lazily-paging generator it does in production.
+"""
+import asyncio
+
+import pytest
+
+cloud_logging = pytest.importorskip("google.cloud.logging")
+from google.auth.credentials import AnonymousCredentials  # noqa: E402
+
+from services import conversation_logger as cl_module  # noqa: E402
+
+LOG_NAME = "projects/test-project/logs/stayforlong-conversations"
+
+
+class _FakeConnection:
+    """Serves entries:list from an in-memory list, one pageSize page per call."""
+
+    def __init__(self, entries: list[dict]):
+        self.entries = entries
+        self.requests: list[dict] = []
+
+    def api_request(self, method, path, data=None, **_kwargs):
+        data = data or {}
+        self.requests.append(data)
+        start = int(data.get("pageToken") or 0)
+        size = int(data.get("pageSize") or len(self.entries) or 1)
+        page = {"entries": self.entries[start:start + size]}
+        if start + size < len(self.entries):
+            page["nextPageToken"] = str(start + size)
+        return page
+
+
+def _message_resource(i: int) -> dict:
+    return {
+        "logName": LOG_NAME,
+        "insertId": f"m{i}",
+        "timestamp": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}Z",
+        "jsonPayload": {
+            "event_type": "message",
+            "conversation_id": "c1",
+            "role": "user" if i % 2 else "assistant",
+            "content": f"message {i}",
+        },
+    }
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    def _make(count: int):
+        client = cloud_logging.Client(
+            project="test-project", credentials=AnonymousCredentials(), _use_grpc=False
+        )
+        client._connection = _FakeConnection([_message_resource(i) for i in range(count)])
+        monkeypatch.setattr(cl_module, "_get_cl", lambda: (client, None))
+        return client
+    return _make
+
+
+async def _collect(conv_id: str, limit: int) -> list[dict]:
+    logger = cl_module.ConversationLogger()
+    return [m async for m in logger.iter_conversation_messages(conv_id, limit=limit)]
+
+
+def test_iter_conversation_messages_yields_whole_thread_in_order(fake_client):
+    client = fake_client(7)
+
+    msgs = asyncio.run(_collect("c1", limit=3))
+
+    assert [m["id"] for m in msgs] == [f"m{i}" for i in range(7)]
+    assert msgs[1]["role"] == "user"
+    assert msgs[1]["content"] == "message 1"
+    # Fetched lazily, one Cloud Logging page per batch.
+    assert [r.get("pageToken") for r in client._connection.requests] == [None, "3", "6"]
+
+
+def test_iter_conversation_messages_matches_get_conversation_messages(fake_client):
+    logger = cl_module.ConversationLogger()
+
+    fake_client(5)
+    streamed = asyncio.run(_collect("c1", limit=2))
+    fake_client(5)
+    listed = asyncio.run(logger.get_conversation_messages("c1", limit=2))
+
+    assert streamed == listed
+
+
+def test_iter_conversation_messages_empty_thread(fake_client):
+    fake_client(0)
+
+    assert asyncio.run(_collect("c1", limit=100)) == []
+
+
+def test_list_conversations_paged_escapes_filter_values(fake_client):
+    client = fake_client(0)
+    logger = cl_module.ConversationLogger()
+
+    asyncio.run(logger.list_conversations_paged(language='es" OR labels.user_id="x', user_id="a\\b"))
+
+    filter_str = client._connection.requests[0]["filter"]
+    assert r'labels.language="es\" OR labels.user_id=\"x"' in filter_str
+    assert r'labels.user_id="a\\b"' in filter_str